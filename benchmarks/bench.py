@@ -0,0 +1,241 @@
+"""
+Speed and memory benchmarks for the public API of housenumparser.
+
+For every API and corpus (see `corpora.py`) this reports the throughput, the
+latency percentiles per call and the peak memory of processing the corpus.
+The results can be saved as a baseline, and a later run can be compared to
+it: the comparison fails when a metric is worse than the baseline by more
+than the threshold.
+
+Usage, from the root of a checkout:
+
+    PYTHONPATH=. python benchmarks/bench.py --save baseline.json
+    PYTHONPATH=. python benchmarks/bench.py --compare baseline.json \
+        --threshold 0.25
+
+or without `PYTHONPATH=.` after `pip install -e .`.
+
+See `memory.py` for the memory used per element by `split`.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import corpora
+
+import housenumparser
+from housenumparser import merger
+from housenumparser import reader
+from housenumparser.element import BisLetter
+from housenumparser.element import BisNumber
+from housenumparser.element import BusLetter
+from housenumparser.element import BusNumber
+from housenumparser.element import HouseNumber
+
+# Metric -> True if higher is better.
+METRICS = {
+    'throughput': True,
+    'p50_us': False,
+    'p95_us': False,
+    'p99_us': False,
+    'peak_kib': False,
+}
+
+
+def _tokens(labels):
+    return [token for label in labels for token in label.split(',')]
+
+
+def _exploded(labels):
+    return [', '.join(str(element) for element in housenumparser.split(label))
+            for label in labels]
+
+
+def _number(element):
+    if isinstance(element, HouseNumber):
+        return element.house_number
+    if isinstance(element, BisNumber):
+        return element.bis_number
+    if isinstance(element, BusNumber):
+        return element.bus_number
+    if isinstance(element, BisLetter):
+        return ord(element.bis_letter)
+    if isinstance(element, BusLetter):
+        return ord(element.bus_letter)
+    return None
+
+
+def _numbers(labels):
+    result = []
+    for label in labels:
+        numbers = [_number(element) for element in housenumparser.split(label)]
+        result.append([number for number in numbers if number is not None])
+    return result
+
+
+def _grouped(labels):
+    return [merger.group(housenumparser.split(label)) for label in labels]
+
+
+def _merge_numbers(numbers):
+    return merger.merge_numbers(numbers, int, lambda first, last: None,
+                                (1, 2))
+
+
+# API -> (function called per input, function turning labels into inputs).
+# The `_many` functions are called once with the whole corpus.
+APIS = {
+    'read_element': (reader.read_element, _tokens),
+    'split': (housenumparser.split, list),
+    'merge': (housenumparser.merge, _exploded),
+    'merge_numbers': (_merge_numbers, _numbers),
+    'merge_data': (merger.merge_data, _grouped),
+    'split_many': (housenumparser.split_many, lambda labels: [labels]),
+    'merge_many': (housenumparser.merge_many,
+                   lambda labels: [_exploded(labels)]),
+}
+
+
+def _percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def measure(function, inputs, labels, repeat):
+    """
+    :type function: Callable
+    :param function: Called once per input.
+
+    :type inputs: list
+    :param inputs: The inputs.
+
+    :type labels: int
+    :param labels: The amount of labels in `inputs`, for the throughput.
+
+    :type repeat: int
+    :param repeat: How many times to process all inputs. The fastest round
+       determines the throughput.
+
+    :returns: A dictionary of the `METRICS`.
+    """
+    latencies = []
+    best = None
+    for _ in range(repeat):
+        total = 0
+        for item in inputs:
+            start = time.perf_counter_ns()
+            function(item)
+            elapsed = time.perf_counter_ns() - start
+            latencies.append(elapsed)
+            total += elapsed
+        best = total if best is None else min(best, total)
+    latencies.sort()
+    # Memory is measured separately, tracemalloc slows everything down.
+    tracemalloc.start()
+    try:
+        results = [function(item) for item in inputs]  # noqa: F841
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {
+        'throughput': labels / (best / 1e9) if best else 0.0,
+        'p50_us': _percentile(latencies, 0.50) / 1e3,
+        'p95_us': _percentile(latencies, 0.95) / 1e3,
+        'p99_us': _percentile(latencies, 0.99) / 1e3,
+        'peak_kib': peak / 1024,
+    }
+
+
+def run(apis, corpus_names, size, repeat):
+    """
+    :returns: A dictionary 'api/corpus' -> dictionary of the `METRICS`.
+    """
+    results = {}
+    for corpus_name in corpus_names:
+        labels = corpora.corpus(corpus_name, size)
+        for api in apis:
+            function, prepare = APIS[api]
+            inputs = prepare(labels)
+            key = f'{api}/{corpus_name}'
+            results[key] = measure(function, inputs, len(labels), repeat)
+            _print_row(key, results[key])
+    return results
+
+
+def _print_row(key, metrics):
+    print(f'{key:<28} {metrics["throughput"]:>12.0f} '
+          f'{metrics["p50_us"]:>9.1f} {metrics["p95_us"]:>9.1f} '
+          f'{metrics["p99_us"]:>9.1f} {metrics["peak_kib"]:>10.1f}')
+
+
+def compare(results, baseline, threshold):
+    """
+    :type threshold: float
+    :param threshold: Allowed relative regression, eg. 0.25 for 25%.
+
+    :returns: A list of regression messages, empty if there are none.
+    """
+    regressions = []
+    for key, metrics in results.items():
+        if key not in baseline:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            old, new = baseline[key][metric], metrics[metric]
+            if not old:
+                continue
+            change = (new - old) / old
+            if (-change if higher_is_better else change) > threshold:
+                regressions.append(f'{key} {metric}: {old:.1f} -> {new:.1f} '
+                                   f'({change:+.0%})')
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--api', action='append', choices=sorted(APIS),
+                        help='Only benchmark this API. Can be repeated.')
+    parser.add_argument('--corpus', action='append',
+                        choices=sorted(corpora.GENERATORS),
+                        help='Only use this corpus. Can be repeated.')
+    parser.add_argument('--size', type=int, default=2000,
+                        help='Labels per corpus. Default: 2000.')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Rounds per benchmark. Default: 3.')
+    parser.add_argument('--save', help='Save the results as a JSON file.')
+    parser.add_argument('--compare', help='Compare to a saved JSON file.')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Allowed relative regression. Default: 0.25.')
+    args = parser.parse_args(argv)
+
+    print(f'{"benchmark":<28} {"labels/s":>12} {"p50 us":>9} {"p95 us":>9} '
+          f'{"p99 us":>9} {"peak KiB":>10}')
+    results = run(args.api or list(APIS),
+                  args.corpus or list(corpora.GENERATORS),
+                  args.size, args.repeat)
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({
+                'python': platform.python_version(),
+                'size': args.size,
+                'results': results,
+            }, f, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if baseline.get('size') != args.size:
+            print(f'Warning: baseline used {baseline.get("size")} labels per '
+                  f'corpus, this run {args.size}.', file=sys.stderr)
+        regressions = compare(results, baseline['results'], args.threshold)
+        for regression in regressions:
+            print(f'REGRESSION {regression}', file=sys.stderr)
+        if regressions:
+            return 1
+        print(f'No regressions beyond {args.threshold:.0%}.')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
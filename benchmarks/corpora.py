@@ -0,0 +1,103 @@
+"""
+Synthetic corpora of Flemish address labels, used by the benchmarks.
+
+Every corpus is generated from a fixed seed, so runs are comparable.
+"""
+import random
+
+SEED = 20240501
+
+
+def _house(rnd):
+    return rnd.randint(1, 400)
+
+
+def plain(rnd):
+    """A handful of single house numbers, eg: '12, 14, 27'."""
+    return ', '.join(str(_house(rnd)) for _ in range(rnd.randint(1, 6)))
+
+
+def runs(rnd):
+    """Long odd or even runs of house numbers, eg: '1-149'."""
+    first = rnd.randint(1, 100)
+    return f'{first}-{first + 2 * rnd.randint(20, 200)}'
+
+
+def apartments(rnd):
+    """Apartment blocks with many bus numbers or letters."""
+    house = _house(rnd)
+    parts = [f'{house} bus {rnd.randint(1, 3)}-{rnd.randint(20, 120)}']
+    if rnd.random() < 0.3:
+        parts.append(f'{house + 2} bus A-{rnd.choice("DFHK")}')
+    if rnd.random() < 0.3:
+        parts.append(f'{house + 4} bus {rnd.randint(1, 9)}')
+    return ', '.join(parts)
+
+
+def bis(rnd):
+    """Bis letters and bis numbers, eg: '7A-C, 9/1-4, 11_2'."""
+    house = _house(rnd)
+    return ', '.join((
+        f'{house}{rnd.choice("AB")}-{rnd.choice("CDEF")}',
+        f'{house + 2}/{rnd.randint(1, 2)}-{rnd.randint(3, 12)}',
+        f'{house + 4}_{rnd.randint(1, 5)}',
+        f'{house + 6}{rnd.choice("ABC")}',
+    ))
+
+
+def malformed(rnd):
+    """Valid numbers mixed with tokens the reader can't understand."""
+    bad = rnd.choice(('onbekend', '12 bis', 'z/n', '4 bus', '7-', '?'))
+    return f'{_house(rnd)}, {bad}, {_house(rnd)}A'
+
+
+def street(rnd):
+    """
+    Every house number of a long street as a single number, with gaps: about
+    3 in 4 are present, eg. '1, 2, 3, 5, 6, 8, ...'. Long enough for the
+    vectorised merge, see `housenumparser.merger.VECTORISE_THRESHOLD`.
+    """
+    last = rnd.randint(6000, 12000)
+    return ', '.join(str(number) for number in range(1, last + 1)
+                     if rnd.random() < 0.77)
+
+
+def mixed(rnd):
+    """A blend of all shapes, weighted towards the common ones."""
+    return rnd.choices(
+        (plain, runs, apartments, bis, malformed),
+        weights=(40, 20, 20, 15, 5),
+    )[0](rnd)
+
+
+GENERATORS = {
+    'plain': plain,
+    'runs': runs,
+    'apartments': apartments,
+    'bis': bis,
+    'malformed': malformed,
+    'mixed': mixed,
+    'street': street,
+}
+
+# Corpus -> how many ordinary labels one of its labels counts for, to keep
+# the time per corpus comparable.
+WEIGHTS = {
+    'street': 1000,
+}
+
+
+def corpus(name, size, seed=SEED):
+    """
+    :type name: str
+    :param name: A key of `GENERATORS`.
+
+    :type size: int
+    :param size: The amount of labels, divided by the weight of the corpus
+       (see `WEIGHTS`), but at least 1.
+
+    :returns: A list of labels.
+    """
+    rnd = random.Random(f'{seed}-{name}')
+    generator = GENERATORS[name]
+    return [generator(rnd) for _ in range(max(1, size // WEIGHTS.get(name, 1)))]
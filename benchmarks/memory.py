@@ -0,0 +1,53 @@
+"""
+Memory benchmark for the results of :func:`housenumparser.split`.
+
+Reports the number of bytes allocated per element, excluding the list that
+holds them.
+
+Usage, from the root of a checkout:
+
+    PYTHONPATH=. python benchmarks/memory.py
+
+or `python benchmarks/memory.py` after `pip install -e .`.
+"""
+import sys
+import tracemalloc
+
+import housenumparser
+
+LABELS = {
+    'HouseNumber': '1-200001',
+    'BisNumber': '23/1-200000',
+    'BisLetter': '23A-Z',
+    'BusNumber': '23 bus 1-200000',
+    'BusLetter': '23 bus A-Z',
+}
+
+
+def bytes_per_element(label):
+    """
+    :type label: str
+    :param label: The label to split.
+
+    :returns: A tuple (amount of elements, bytes per element).
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = housenumparser.split(label)
+        allocated = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    allocated -= sys.getsizeof(result)
+    return len(result), allocated / len(result)
+
+
+def main():
+    print(f'{"element":<12} {"count":>8} {"bytes/element":>14}')
+    for name, label in LABELS.items():
+        count, size = bytes_per_element(label)
+        print(f'{name:<12} {count:>8} {size:>14.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,13 +1,38 @@
+import concurrent.futures
+import functools
 import logging
+import os
 
 from housenumparser import merger
+from housenumparser import ranges
 from housenumparser import reader
+from housenumparser import stats
 from housenumparser.element import ReadException
+from housenumparser.element import SequenceElement
+from housenumparser.element import SingleElement
+from housenumparser.aio import async_merge  # noqa
+from housenumparser.aio import async_merge_many  # noqa
+from housenumparser.aio import async_split  # noqa
+from housenumparser.aio import async_split_many  # noqa
+from housenumparser.canonical import canonical_key  # noqa
+from housenumparser.canonical import normalize  # noqa
+from housenumparser.incremental import Merger  # noqa
+from housenumparser.reader import validate  # noqa
+from housenumparser.reader import validate_many  # noqa
+from housenumparser.records import merge_records  # noqa
+from housenumparser.records import split_records  # noqa
+from housenumparser.records import to_json  # noqa
+from housenumparser.sets import HouseNumberSet
 
 LOG = logging.getLogger(__name__)
 
+# Below this amount of labels, `split_many` and `merge_many` don't start a
+# process pool: its start-up would take longer than the work itself.
+POOL_THRESHOLD = 1000
 
-def split(data, step=None, on_exc=ReadException.Action.ERROR_MSG):
+
+def split(data, step=None, on_exc=ReadException.Action.ERROR_MSG,
+          unique=False):
     """
     Parses a string of house number series and returns single numbers.
 
@@ -23,20 +48,66 @@ def split(data, step=None, on_exc=ReadException.Action.ERROR_MSG):
     :type on_exc: :class:`.element.ReadException.Action`
     :param on_exc: Flag on how to treat incorrect data. Default ERROR_MSG.
 
+    :type unique: bool
+    :param unique: When True, every house number is returned once, ordered
+       by element type, house number and number, followed by the incorrect
+       data. The series are combined as ranges first, so overlapping series
+       are only expanded once. Default False, every series is expanded in
+       the order of `data`.
+
     :returns: A list of :class:`.element.SingleElement`
     """
+    collector = stats.collector
+    if collector is None:
+        return list(iter_split(data, step=step, on_exc=on_exc, unique=unique))
+    with collector.timer('split'):
+        return list(iter_split(data, step=step, on_exc=on_exc, unique=unique))
+
+
+def iter_split(data, step=None, on_exc=ReadException.Action.ERROR_MSG,
+               unique=False):
+    """
+    Generator variant of :func:`split`. Single numbers are yielded one at a
+    time, so sequences are never expanded in memory as a whole.
+
+    :type data: Union[str, list[str]]
+    :param data: house number and/or house number series representations
+
+    :type step: int
+    :param step: Amount of house numbers per step. See :func:`split`.
+
+    :type on_exc: :class:`.element.ReadException.Action`
+    :param on_exc: Flag on how to treat incorrect data. Default ERROR_MSG.
+
+    :type unique: bool
+    :param unique: Whether to yield every house number once, in order.
+       See :func:`split`.
+
+    :returns: A generator of :class:`.element.SingleElement`
+    """
     try:
+        if unique:
+            numbers = HouseNumberSet(data, step=step, on_exc=on_exc)
+            yield from numbers
+            yield from numbers.bad_data
+            return
         if isinstance(data, list):
-            numbers = reader.read_iterable(data, step=step, on_exc=on_exc)
+            numbers = reader.iter_read_iterable(data, step=step,
+                                                on_exc=on_exc)
         else:
-            numbers = reader.read_data(data, step=step, on_exc=on_exc)
-        return [item for number in numbers for item in number.split()]
+            numbers = reader.iter_read_data(data, step=step, on_exc=on_exc)
+        collector = stats.collector
+        for number in numbers:
+            if collector is not None and isinstance(number, SequenceElement):
+                collector.record_expansion(type(number), len(number.view()))
+            yield from number.iter_split()
     except Exception:  # noqa
         LOG.error(f"Could not split data: {data}")
         raise
 
 
-def merge(data, on_exc=ReadException.Action.ERROR_MSG):
+def merge(data, on_exc=ReadException.Action.ERROR_MSG,
+          order=merger.InputOrder.UNSORTED):
     """
     Parses a string or list of house number series and returns elements merged
     into sequences if possible.
@@ -47,11 +118,168 @@ def merge(data, on_exc=ReadException.Action.ERROR_MSG):
     :type on_exc: :class:`.element.ReadException.Action`
     :param on_exc: Flag on how to treat incorrect data. Default ERROR_MSG.
 
+    :type order: :class:`.merger.InputOrder`
+    :param order: Whether the single house numbers in `data` are known to be
+       in ascending order, without duplicates, per type and house number.
+       Series are merged as ranges, which never need sorting. Default
+       UNSORTED.
+
     :returns: A list of :class:`.element.Element`
     """
     try:
-        numbers = split(data, on_exc=on_exc)
-        return merger.merge_data(merger.group(numbers))
+        collector = stats.collector
+        if collector is None:
+            return ranges.merge(data, on_exc=on_exc, order=order)
+        # Time every stage on its own, instead of streaming the elements.
+        with collector.timer('read'):
+            elements = list(ranges.read(data, on_exc=on_exc))
+        with collector.timer('group'):
+            buckets = ranges.bucket(elements)
+        with collector.timer('merge_data'):
+            return ranges.merge_buckets(buckets, on_exc=on_exc,
+                                        order=order)
     except Exception:  # noqa
         LOG.error(f"Could not merge data: {data}")
         raise
+
+
+def contains(label, address, step=None,
+             on_exc=ReadException.Action.ERROR_MSG):
+    """
+    Checks whether a label describes an address, without splitting the label.
+
+    eg: contains('1-9, 23 bus 1-40', '23 bus 4') -> True
+
+    :type label: Union[str, list[str]]
+    :param label: house number and/or house number series representations
+
+    :type address: Union[str, .element.Element]
+    :param address: The address to look for. When it describes more than a
+       single house number, all of them must be in `label`.
+
+    :type step: int
+    :param step: Amount of house numbers per step. See :func:`split`.
+
+    :type on_exc: :class:`.element.ReadException.Action`
+    :param on_exc: Flag on how to treat incorrect data. Default ERROR_MSG.
+       Incorrect data never contains anything.
+
+    :returns: True if every house number of `address` is in `label`.
+    """
+    addresses = list(ranges.read(address, step=step, on_exc=on_exc))
+    if not addresses or any(isinstance(element, ReadException)
+                            for element in addresses):
+        return False
+    if len(addresses) > 1 or not isinstance(addresses[0], SingleElement):
+        return HouseNumberSet(addresses, on_exc=on_exc).issubset(
+            HouseNumberSet(label, step=step, on_exc=on_exc)
+        )
+    address = addresses[0]
+    kind, key, value, _, _ = ranges.bounds(address)
+    for element in ranges.read(label, step=step, on_exc=on_exc):
+        if isinstance(element, SequenceElement):
+            # A view checks the bounds and the step of the series.
+            if address in element.view():
+                return True
+        elif (isinstance(element, SingleElement)
+              and ranges.bounds(element)[:3] == (kind, key, value)):
+            return True
+    return False
+
+
+def count(label, step=None, distinct=True,
+          on_exc=ReadException.Action.ERROR_MSG):
+    """
+    Counts the house numbers of a label, without splitting it.
+
+    eg: count('1-9, 23 bus 1-40') -> 45
+
+    :type label: Union[str, list[str]]
+    :param label: house number and/or house number series representations
+
+    :type step: int
+    :param step: Amount of house numbers per step. See :func:`split`.
+
+    :type distinct: bool
+    :param distinct: Whether to count a house number which occurs more than
+       once in `label` only once. Default True. When False, the result equals
+       the length of :func:`split`, minus the incorrect data.
+
+    :type on_exc: :class:`.element.ReadException.Action`
+    :param on_exc: Flag on how to treat incorrect data. Default ERROR_MSG.
+       Incorrect data isn't counted.
+
+    :returns: The amount of house numbers.
+    """
+    if distinct:
+        return len(HouseNumberSet(label, step=step, on_exc=on_exc))
+    return sum(len(element.view()) if isinstance(element, SequenceElement)
+               else 1
+               for element in ranges.read(label, step=step, on_exc=on_exc)
+               if not isinstance(element, ReadException))
+
+
+def split_many(labels, step=None, on_exc=ReadException.Action.ERROR_MSG,
+               workers=None, chunksize=None):
+    """
+    Splits many independent labels, spread over a pool of processes.
+
+    :type labels: Iterable[Union[str, list[str]]]
+    :param labels: labels as accepted by :func:`split`
+
+    :type step: int
+    :param step: Amount of house numbers per step. See :func:`split`.
+
+    :type on_exc: :class:`.element.ReadException.Action`
+    :param on_exc: Flag on how to treat incorrect data. Default ERROR_MSG.
+
+    :type workers: int
+    :param workers: Amount of processes. Default None, meaning the amount of
+       CPUs. With 1 worker, or less than `POOL_THRESHOLD` labels, all work is
+       done in the current process.
+
+    :type chunksize: int
+    :param chunksize: Amount of labels sent to a process at once. Default
+       None, which divides the labels in 4 chunks per worker.
+
+    :returns: A list with the result of :func:`split` for every label, in
+       the order of `labels`.
+    """
+    return _map_many(functools.partial(split, step=step, on_exc=on_exc),
+                     labels, workers, chunksize)
+
+
+def merge_many(labels, on_exc=ReadException.Action.ERROR_MSG, workers=None,
+               chunksize=None):
+    """
+    Merges many independent labels, spread over a pool of processes.
+
+    :type labels: Iterable[Union[str, list[str]]]
+    :param labels: labels as accepted by :func:`merge`
+
+    :type on_exc: :class:`.element.ReadException.Action`
+    :param on_exc: Flag on how to treat incorrect data. Default ERROR_MSG.
+
+    :type workers: int
+    :param workers: Amount of processes. See :func:`split_many`.
+
+    :type chunksize: int
+    :param chunksize: Amount of labels sent to a process at once. See
+       :func:`split_many`.
+
+    :returns: A list with the result of :func:`merge` for every label, in
+       the order of `labels`.
+    """
+    return _map_many(functools.partial(merge, on_exc=on_exc),
+                     labels, workers, chunksize)
+
+
+def _map_many(function, labels, workers, chunksize):
+    labels = list(labels)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(labels) < POOL_THRESHOLD:
+        return [function(label) for label in labels]
+    if chunksize is None:
+        chunksize = max(1, len(labels) // (workers * 4))
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        return list(executor.map(function, labels, chunksize=chunksize))
@@ -0,0 +1,228 @@
+"""
+Module with an asyncio API, which runs the parsing and merging in an
+executor so the event loop isn't blocked.
+
+eg:
+    elements = await async_merge('1, 3, 5, 4 bus 1-30')
+
+    with concurrent.futures.ProcessPoolExecutor() as executor:
+        async for elements in async_split_many(labels, executor=executor):
+            ...
+
+With the default executor of the loop (threads), the event loop stays
+responsive, but the work itself doesn't run in parallel. Use a
+:class:`concurrent.futures.ProcessPoolExecutor` to use multiple cores.
+"""
+
+import asyncio
+import collections
+import functools
+
+import housenumparser
+from housenumparser import merger
+from housenumparser.element import ReadException
+
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_MAX_PENDING = 4
+
+_DONE = object()
+
+
+class _Failure:
+    """Wraps an exception of the label source, to pass it through a queue."""
+
+    def __init__(self, exception):
+        self.exception = exception
+
+
+async def async_split(data, step=None, on_exc=ReadException.Action.ERROR_MSG,
+                      executor=None):
+    """
+    :func:`housenumparser.split`, run in `executor`.
+
+    :type executor: concurrent.futures.Executor
+    :param executor: Executor to run in. Default None, the default executor
+       of the loop.
+
+    See :func:`housenumparser.split` for the other parameters.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor,
+        functools.partial(housenumparser.split, data, step=step, on_exc=on_exc)
+    )
+
+
+async def async_merge(data, on_exc=ReadException.Action.ERROR_MSG,
+                      order=merger.InputOrder.UNSORTED, executor=None):
+    """
+    :func:`housenumparser.merge`, run in `executor`.
+
+    :type executor: concurrent.futures.Executor
+    :param executor: Executor to run in. Default None, the default executor
+       of the loop.
+
+    See :func:`housenumparser.merge` for the other parameters.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor,
+        functools.partial(housenumparser.merge, data, on_exc=on_exc,
+                          order=order)
+    )
+
+
+def async_split_many(labels, step=None,
+                     on_exc=ReadException.Action.ERROR_MSG, executor=None,
+                     batch_size=DEFAULT_BATCH_SIZE,
+                     max_pending=DEFAULT_MAX_PENDING):
+    """
+    Splits a stream of labels in batches, run in `executor`.
+
+    :type labels: Union[AsyncIterable, Iterable]
+    :param labels: labels as accepted by :func:`housenumparser.split`
+
+    :type step: int
+    :param step: Amount of house numbers per step.
+       See :func:`housenumparser.split`.
+
+    :type on_exc: :class:`.element.ReadException.Action`
+    :param on_exc: Flag on how to treat incorrect data. Default ERROR_MSG.
+
+    :type executor: concurrent.futures.Executor
+    :param executor: Executor to run the batches in. Default None, the
+       default executor of the loop.
+
+    :type batch_size: int
+    :param batch_size: Maximum amount of labels per batch. A batch holds the
+       labels available at the moment, so a slow source gives small batches
+       instead of waiting. Default `DEFAULT_BATCH_SIZE`.
+
+    :type max_pending: int
+    :param max_pending: Maximum amount of batches in the executor. When
+       reached, no more labels are read until the oldest batch is done.
+       Default `DEFAULT_MAX_PENDING`.
+
+    :returns: An async generator with the result of
+       :func:`housenumparser.split` for every label, in the order of
+       `labels`. Closing it, or cancelling the task using it, cancels the
+       batches which haven't started yet.
+    """
+    return _map_async(
+        functools.partial(housenumparser.split, step=step, on_exc=on_exc),
+        labels, executor, batch_size, max_pending
+    )
+
+
+def async_merge_many(labels, on_exc=ReadException.Action.ERROR_MSG,
+                     order=merger.InputOrder.UNSORTED, executor=None,
+                     batch_size=DEFAULT_BATCH_SIZE,
+                     max_pending=DEFAULT_MAX_PENDING):
+    """
+    Merges a stream of labels in batches, run in `executor`.
+
+    :type labels: Union[AsyncIterable, Iterable]
+    :param labels: labels as accepted by :func:`housenumparser.merge`
+
+    :type order: :class:`.merger.InputOrder`
+    :param order: What is known about the order of the labels' house
+       numbers. See :func:`housenumparser.merge`.
+
+    See :func:`async_split_many` for the other parameters.
+
+    :returns: An async generator with the result of
+       :func:`housenumparser.merge` for every label, in the order of
+       `labels`.
+    """
+    return _map_async(
+        functools.partial(housenumparser.merge, on_exc=on_exc, order=order),
+        labels, executor, batch_size, max_pending
+    )
+
+
+def _map_batch(function, batch):
+    return [function(label) for label in batch]
+
+
+async def _iterate(labels):
+    if hasattr(labels, '__aiter__'):
+        async for label in labels:
+            yield label
+    else:
+        for label in labels:
+            yield label
+
+
+async def _batches(labels, batch_size, queue_size):
+    """
+    Reads `labels` in a separate task into a bounded queue, and yields lists
+    of the labels in the queue.
+    """
+    queue = asyncio.Queue(queue_size)
+
+    async def produce():
+        try:
+            async for label in _iterate(labels):
+                await queue.put(label)
+        except Exception as e:  # noqa
+            await queue.put(_Failure(e))
+        else:
+            await queue.put(_DONE)
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            last = batch[-1]
+            if last is _DONE or isinstance(last, _Failure):
+                if len(batch) > 1:
+                    yield batch[:-1]
+                if last is _DONE:
+                    return
+                raise last.exception
+            yield batch
+    finally:
+        producer.cancel()
+
+
+async def _map_async(function, labels, executor, batch_size, max_pending):
+    if batch_size < 1 or max_pending < 1:
+        raise ValueError('batch_size and max_pending must be at least 1')
+    loop = asyncio.get_running_loop()
+    batches = _batches(labels, batch_size, batch_size * max_pending)
+    pending = collections.deque()
+    next_batch = None
+    exhausted = False
+    try:
+        while pending or not exhausted:
+            if (next_batch is None and not exhausted
+                    and len(pending) < max_pending):
+                next_batch = asyncio.ensure_future(batches.__anext__())
+            waiting = {pending[0]} if pending else set()
+            if next_batch is not None:
+                waiting.add(next_batch)
+            await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+            # Results are passed on in order, as soon as they're available.
+            while pending and pending[0].done():
+                for result in pending.popleft().result():
+                    yield result
+            if next_batch is not None and next_batch.done():
+                try:
+                    batch = next_batch.result()
+                except StopAsyncIteration:
+                    exhausted = True
+                else:
+                    pending.append(loop.run_in_executor(
+                        executor, _map_batch, function, batch
+                    ))
+                next_batch = None
+    finally:
+        if next_batch is not None:
+            next_batch.cancel()
+            # The generator of batches can only be closed once it stopped.
+            await asyncio.wait({next_batch})
+        for future in pending:
+            future.cancel()
+        await batches.aclose()
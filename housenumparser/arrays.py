@@ -0,0 +1,165 @@
+"""
+Module which splits labels into NumPy arrays, one per column, instead of
+lists of :class:`housenumparser.element.SingleElement`.
+
+Sequences are expanded with `numpy.arange`, without creating an element per
+number. This module needs the optional NumPy dependency, installable with
+`pip install housenumparser[numpy]`.
+"""
+
+import collections
+
+from housenumparser import merger
+from housenumparser import reader
+from housenumparser.element import BisLetter
+from housenumparser.element import BisNumber
+from housenumparser.element import BusLetter
+from housenumparser.element import BusNumber
+from housenumparser.element import HouseNumber
+from housenumparser.element import ReadException
+from housenumparser.element import SequenceElement
+from housenumparser.merger import KINDS
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+# The first 5 columns hold the value that varies within a series, in the
+# order of `merger.KINDS`: the `kind` of an element is also its column.
+COLUMNS = ('house_number', 'bis_number', 'bus_number', 'bis_letter',
+           'bus_letter', 'kind', 'label_index', 'bis_separator')
+
+SplitArrays = collections.namedtuple('SplitArrays', COLUMNS + ('errors',))
+SplitArrays.__doc__ = """
+Split labels as columns. Every column is a :class:`numpy.ndarray` with one
+row per single element, in the order :func:`housenumparser.split` returns
+them.
+
+- house_number, bis_number, bus_number: the numbers, -1 when not applicable.
+- bis_letter, bus_letter: `ord` of the letter, -1 when not applicable.
+- kind: index of the element type in :data:`.merger.KINDS`.
+- label_index: index of the label the element comes from.
+- bis_separator: `ord` of the separator of a bis number ('/' or '_'), -1
+  when not applicable.
+
+Unparseable data can't be stored in these columns, so `errors` is a list of
+tuples (label_index, :class:`.element.ReadException`) instead.
+"""
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError('NumPy is required for housenumparser.arrays, '
+                          'install it with: pip install housenumparser[numpy]')
+
+
+def _row(single, label_index):
+    """
+    :returns: The values of a :class:`.element.SingleElement` as a tuple in
+       the order of :data:`COLUMNS`.
+    """
+    bis_letter = single.first_bis_letter
+    bus_letter = single.first_bus_letter
+    separator = -1
+    if isinstance(single, BisNumber):
+        separator = ord('_' if '_' in single.original_string else '/')
+    return (single.first_house_number, single.first_bis_number,
+            single.first_bus_number,
+            -1 if bis_letter == -1 else ord(bis_letter),
+            -1 if bus_letter == -1 else ord(bus_letter),
+            merger._KIND_INDEX[type(single)], label_index, separator)
+
+
+def _sequence_columns(sequence, label_index):
+    """
+    :returns: A list of arrays in the order of :data:`COLUMNS` with all
+       single elements of `sequence`, expanded by `numpy.arange`.
+    """
+    values = sequence.view().values
+    expanded = np.arange(values.start, values.stop, values.step,
+                         dtype=np.int64)
+    # Take the constant columns from the first element of the series.
+    columns = [np.full(len(expanded), value, dtype=np.int64)
+               for value in _row(sequence.view()[0], label_index)]
+    columns[columns[5][0]] = expanded
+    return columns
+
+
+def split_to_arrays(labels, step=None, on_exc=ReadException.Action.ERROR_MSG):
+    """
+    Splits labels into NumPy columns.
+
+    :type labels: Iterable[Union[str, list[str]]]
+    :param labels: labels as accepted by :func:`housenumparser.split`. A
+       single :class:`str` is treated as one label.
+
+    :type step: int
+    :param step: Amount of house numbers per step. See
+       :func:`housenumparser.split`.
+
+    :type on_exc: :class:`.element.ReadException.Action`
+    :param on_exc: Flag on how to treat incorrect data. Default ERROR_MSG.
+
+    :returns: A :class:`SplitArrays`.
+    """
+    _require_numpy()
+    if isinstance(labels, str):
+        labels = [labels]
+    chunks = []
+    rows = []
+    errors = []
+    for label_index, label in enumerate(labels):
+        if isinstance(label, list):
+            elements = reader.iter_read_iterable(label, step=step,
+                                                 on_exc=on_exc)
+        else:
+            elements = reader.iter_read_data(label, step=step, on_exc=on_exc)
+        for element in elements:
+            if isinstance(element, ReadException):
+                errors.append((label_index, element))
+            elif isinstance(element, SequenceElement):
+                if rows:
+                    chunks.append(np.array(rows, dtype=np.int64).T)
+                    rows = []
+                chunks.append(_sequence_columns(element, label_index))
+            else:
+                rows.append(_row(element, label_index))
+    if rows or not chunks:
+        chunks.append(np.array(rows, dtype=np.int64)
+                      .reshape(-1, len(COLUMNS)).T)
+    columns = [np.concatenate([chunk[i] for chunk in chunks])
+               for i in range(len(COLUMNS))]
+    columns[5] = columns[5].astype(np.int8)
+    return SplitArrays(*columns, errors=errors)
+
+
+def arrays_to_elements(arrays):
+    """
+    Turns the columns of :func:`split_to_arrays` back into elements.
+
+    :type arrays: SplitArrays
+    :param arrays: The columns.
+
+    :returns: A list of :class:`.element.SingleElement`.
+    """
+    _require_numpy()
+    result = []
+    for (house_number, bis_number, bus_number, bis_letter, bus_letter, kind,
+         _, separator) in zip(*(arrays[i].tolist()
+                                for i in range(len(COLUMNS)))):
+        element_class = KINDS[kind].single_class
+        if element_class is HouseNumber:
+            result.append(HouseNumber(house_number))
+        elif element_class is BisNumber:
+            result.append(BisNumber(
+                house_number, bis_number,
+                f'{house_number}{chr(separator)}{bis_number}'
+            ))
+        elif element_class is BisLetter:
+            result.append(BisLetter(house_number, chr(bis_letter)))
+        elif element_class is BusNumber:
+            result.append(BusNumber(house_number, bus_number))
+        else:
+            result.append(BusLetter(house_number, chr(bus_letter)))
+    return result
@@ -0,0 +1,77 @@
+"""
+Module with a small, size-bounded least recently used cache.
+"""
+
+import collections
+import threading
+
+CacheInfo = collections.namedtuple(
+    'CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize']
+)
+
+
+class LRUCache:
+    """
+    A thread-safe mapping which holds at most `maxsize` items. When full, the
+    least recently used item is evicted to make room for a new one.
+    """
+
+    def __init__(self, maxsize):
+        """
+        :type maxsize: int
+        :param maxsize: Maximum amount of items in the cache.
+        """
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1')
+        self.maxsize = maxsize
+        self._data = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = 0
+
+    def get(self, key, default=None):
+        """
+        :returns: The cached value for `key`, or `default` if not cached.
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return default
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key, value):
+        """
+        Stores `value` for `key`, evicting the least recently used item if the
+        cache is full.
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self):
+        """
+        Removes all items and resets the statistics.
+        """
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def info(self):
+        """
+        :returns: A :class:`CacheInfo` with the statistics of the cache.
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions,
+                             self.maxsize, len(self._data))
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
@@ -0,0 +1,114 @@
+"""
+Module which turns labels into a canonical form, to compare or deduplicate
+them.
+
+eg:
+    normalize('29, 27 ,25') -> '25-29'
+    normalize('25-29') -> '25-29'
+    canonical_key('25,27,29') -> (((0, 0, 25, 29),), ())
+"""
+
+from housenumparser import ranges
+from housenumparser.cache import LRUCache
+from housenumparser.element import ReadException
+from housenumparser.sets import HouseNumberSet
+
+DEFAULT_CACHE_SIZE = 10000
+
+# Cache of `_canonical` results, see `configure_cache`. Disabled by default.
+_cache = None
+
+
+def configure_cache(maxsize=DEFAULT_CACHE_SIZE):
+    """
+    Enables, resizes or disables the cache of :func:`normalize` and
+    :func:`canonical_key`. Only labels given as :class:`str` are cached.
+
+    :type maxsize: int
+    :param maxsize: Maximum amount of cached labels. When `None` or 0, the
+       cache is disabled. Default `DEFAULT_CACHE_SIZE`.
+    """
+    global _cache
+    _cache = LRUCache(maxsize) if maxsize else None
+
+
+def clear_cache():
+    """
+    Empties the cache and resets its statistics.
+    """
+    if _cache is not None:
+        _cache.clear()
+
+
+def cache_info():
+    """
+    :returns: A :class:`.cache.CacheInfo` of the cache, or None when the
+       cache is disabled.
+    """
+    if _cache is None:
+        return None
+    return _cache.info()
+
+
+def _canonical(label, on_exc):
+    """
+    :returns: A tuple (key, string), see :func:`canonical_key` and
+       :func:`normalize`.
+    """
+    cacheable = _cache is not None and isinstance(label, str)
+    if cacheable:
+        result = _cache.get((label, on_exc))
+        if result is not None:
+            return result
+    numbers = HouseNumberSet(label, on_exc=on_exc)
+    runs = []
+    strings = []
+    for kind, house_number, first, last in numbers.runs():
+        runs.append((ranges._KIND_INDEX[kind], house_number or 0, first, last))
+        # Without original string, bis numbers are written with a '/'.
+        strings.append(str(ranges.build(kind, house_number, first, last)))
+    bad_data = tuple(sorted(str(element) for element in numbers.bad_data))
+    result = ((tuple(runs), bad_data), ', '.join(strings + list(bad_data)))
+    if cacheable:
+        _cache.put((label, on_exc), result)
+    return result
+
+
+def normalize(label, on_exc=ReadException.Action.ERROR_MSG):
+    """
+    Merges a label into its canonical form: labels describing the same
+    house numbers have the same canonical form.
+
+    The result is merged like :func:`housenumparser.merge`, ordered by element
+    type, house number and number, with bis numbers written with a '/'.
+    Incorrect data follows in alphabetical order.
+
+    eg: '29, 27 ,25', '25-29' and '25,27,29' -> '25-29'
+
+    :type label: Union[str, list[str]]
+    :param label: house number and/or house number series representations
+
+    :type on_exc: :class:`.element.ReadException.Action`
+    :param on_exc: Flag on how to treat incorrect data. Default ERROR_MSG.
+
+    :returns: The canonical label, a :class:`str`.
+    """
+    return _canonical(label, on_exc)[1]
+
+
+def canonical_key(label, on_exc=ReadException.Action.ERROR_MSG):
+    """
+    A hashable key of a label: labels with the same :func:`normalize` result
+    have the same key.
+
+    :type label: Union[str, list[str]]
+    :param label: house number and/or house number series representations
+
+    :type on_exc: :class:`.element.ReadException.Action`
+    :param on_exc: Flag on how to treat incorrect data. Default ERROR_MSG.
+
+    :returns: A tuple (runs, bad data). Runs is a tuple of (element type,
+       house number, first, last) tuples of ints, letters as their `ord`.
+       Bad data is a tuple with the strings of the incorrect data.
+    """
+    return _canonical(label, on_exc)[0]
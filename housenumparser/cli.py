@@ -0,0 +1,224 @@
+"""
+Command line tool which splits or merges the labels of a file or stdin.
+
+eg:
+    housenumparser split addresses.csv --column label > split.csv
+    cat labels.txt | housenumparser merge --workers 4
+
+The input is streamed in batches, so memory use doesn't grow with the size
+of the input. With multiple workers the batches are processed by a pool of
+processes, while the output keeps the order of the input.
+"""
+
+import argparse
+import collections
+import concurrent.futures
+import contextlib
+import csv
+import functools
+import sys
+import time
+
+import housenumparser
+from housenumparser.element import ReadException
+
+BATCH_SIZE = 1000
+
+FORMATS = {
+    'lines': None,
+    'csv': ',',
+    'tsv': '\t',
+}
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog='housenumparser',
+        description='Split or merge Belgian house number labels.'
+    )
+    parser.add_argument('mode', choices=('split', 'merge'))
+    parser.add_argument('input', nargs='?', default='-',
+                        help='Input file. Default: stdin.')
+    parser.add_argument('-o', '--output', default='-',
+                        help='Output file. Default: stdout.')
+    parser.add_argument('-f', '--format', choices=sorted(FORMATS),
+                        help='Input format. Default: based on the extension '
+                             'of the input file, lines for stdin.')
+    parser.add_argument('-c', '--column', default='0',
+                        help='Name or index of the column with the labels, '
+                             'for csv and tsv. A name means the first row '
+                             'is a header. Default: 0.')
+    parser.add_argument('--step', type=int,
+                        help='Amount of house numbers per step in a series.')
+    parser.add_argument('--on-exc', default='error_msg',
+                        choices=[action.name.lower()
+                                 for action in ReadException.Action],
+                        help='What to do with incorrect data. '
+                             'Default: error_msg.')
+    parser.add_argument('-w', '--workers', type=int, default=1,
+                        help='Amount of processes. Default: 1.')
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help="Don't report the throughput on stderr.")
+    args = parser.parse_args(argv)
+    if args.format is None:
+        extension = args.input.rsplit('.', 1)[-1].lower()
+        args.format = extension if extension in ('csv', 'tsv') else 'lines'
+    args.on_exc = ReadException.Action[args.on_exc.upper()]
+    return args
+
+
+def process_labels(labels, mode, step=None,
+                   on_exc=ReadException.Action.ERROR_MSG):
+    """
+    Splits or merges labels.
+
+    :type labels: list[str]
+    :param labels: The labels. None for rows without a label.
+
+    :type mode: str
+    :param mode: 'split' or 'merge'.
+
+    :type step: int
+    :param step: Amount of house numbers per step, used when splitting.
+
+    :type on_exc: :class:`.element.ReadException.Action`
+    :param on_exc: Flag on how to treat incorrect data. Default ERROR_MSG.
+
+    :returns: Per label, a list of output strings: every single element
+       when splitting, the merged label when merging. None for a missing
+       label.
+    """
+    if mode == 'split':
+        return [None if label is None else
+                [str(element) for element
+                 in housenumparser.iter_split(label, step=step,
+                                              on_exc=on_exc)]
+                for label in labels]
+    return [None if label is None else
+            [', '.join(str(element) for element
+                       in housenumparser.merge(label, on_exc=on_exc))]
+            for label in labels]
+
+
+def _batches(rows, size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _map_batches(function, batches, workers):
+    """
+    Applies `function` to the labels of every batch, spread over `workers`
+    processes.
+
+    Only the labels are sent to the workers. At most 2 batches per worker
+    are in progress at any time.
+
+    :type batches: iterator
+    :param batches: An iterator of (rows, labels) tuples.
+
+    :returns: An iterator of (rows, result) tuples, in the order of
+       `batches`.
+    """
+    if workers <= 1:
+        for rows, labels in batches:
+            yield rows, function(labels)
+        return
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        pending = collections.deque()
+        for rows, labels in batches:
+            pending.append((rows, executor.submit(function, labels)))
+            if len(pending) >= workers * 2:
+                rows, future = pending.popleft()
+                yield rows, future.result()
+        while pending:
+            rows, future = pending.popleft()
+            yield rows, future.result()
+
+
+def _open(path, mode):
+    if path == '-':
+        return contextlib.nullcontext(sys.stdin if mode == 'r' else sys.stdout)
+    return open(path, mode, newline='', encoding='utf-8')
+
+
+def run(args, infile, outfile):
+    """
+    Streams the labels of `infile` to `outfile`.
+
+    :returns: A tuple (amount of labels, amount of output rows).
+    """
+    delimiter = FORMATS[args.format]
+    labels = rows_out = 0
+    if delimiter is None:
+        rows = (line.rstrip('\r\n') for line in infile)
+        label_of = str
+        writer = None
+    else:
+        rows = csv.reader(infile, delimiter=delimiter)
+        writer = csv.writer(outfile, delimiter=delimiter,
+                            lineterminator='\n')
+        column = args.column
+        if not column.isdigit():
+            header = next(rows, None)
+            if header is None:
+                return 0, 0
+            if column not in header:
+                raise ValueError(f'Column {column!r} not in header.')
+            column = header.index(column)
+            writer.writerow(header)
+        column = int(column)
+
+        def label_of(row):
+            # Blank lines and rows without the column are passed through.
+            return row[column] if column < len(row) else None
+
+    function = functools.partial(process_labels, mode=args.mode,
+                                 step=args.step, on_exc=args.on_exc)
+    batches = (
+        (batch, [label_of(row) for row in batch])
+        for batch in _batches(rows, BATCH_SIZE)
+    )
+    for batch, results in _map_batches(function, batches, args.workers):
+        labels += len(batch)
+        for row, outputs in zip(batch, results):
+            if outputs is None:
+                rows_out += 1
+                writer.writerow(row)
+                continue
+            for output in outputs:
+                rows_out += 1
+                if writer is None:
+                    outfile.write(output + '\n')
+                else:
+                    row = list(row)
+                    row[column] = output
+                    writer.writerow(row)
+    return labels, rows_out
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    start = time.perf_counter()
+    try:
+        with _open(args.input, 'r') as infile, \
+                _open(args.output, 'w') as outfile:
+            labels, rows_out = run(args, infile, outfile)
+    except (ValueError, OSError) as e:
+        print(f'housenumparser: {e}', file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - start
+    if not args.quiet:
+        rate = labels / elapsed if elapsed else 0
+        print(f'{labels} labels -> {rows_out} rows in {elapsed:.2f}s '
+              f'({rate:.0f} labels/s)', file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
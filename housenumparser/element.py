@@ -1,6 +1,112 @@
+import collections.abc
 import re
 from enum import Enum
 
+from housenumparser.cache import LRUCache
+
+DEFAULT_INTERN_SIZE = 100000
+
+# Shared single elements, see `configure_interning`. Disabled by default.
+_intern_table = None
+
+
+def configure_interning(maxsize=DEFAULT_INTERN_SIZE):
+    """
+    Enables, resizes or disables interning of single elements.
+
+    When enabled, :func:`.reader.read_element` and the splitting of series
+    return one shared :class:`HouseNumber`, :class:`BisNumber`,
+    :class:`BisLetter`, :class:`BusNumber` or :class:`BusLetter` object per
+    distinct address, as long as it's in the bounded intern table. This saves
+    allocations in large jobs, and makes deduplication by identity possible.
+
+    Bis numbers are shared per notation: '12/1-3' and '12/2' give the same
+    '12/2', with its own label as original string.
+
+    As changing a shared element would change it for every holder, single
+    elements are read-only while interning is enabled: setting an attribute
+    after creation raises an :class:`AttributeError`. This guard slows down
+    the creation of elements, so it's only installed when enabling.
+
+    :type maxsize: int
+    :param maxsize: Maximum amount of interned elements. When `None` or 0,
+       interning is disabled. Default `DEFAULT_INTERN_SIZE`.
+    """
+    global _intern_table
+    _intern_table = LRUCache(maxsize) if maxsize else None
+    if _intern_table is not None:
+        SingleElement.__setattr__ = _read_only_setattr
+    elif '__setattr__' in SingleElement.__dict__:
+        del SingleElement.__setattr__
+
+
+def _read_only_setattr(self, name, value):
+    """
+    `__setattr__` of single elements while interning is enabled, which only
+    allows to set a slot once, when creating or unpickling the element.
+    """
+    try:
+        getattr(self, name)
+    except AttributeError:
+        object.__setattr__(self, name, value)
+        return
+    raise AttributeError(f"{type(self).__name__} elements are read-only "
+                         f"while interning is enabled")
+
+
+def clear_interning():
+    """
+    Empties the intern table and resets its statistics.
+    """
+    if _intern_table is not None:
+        _intern_table.clear()
+
+
+def interning_info():
+    """
+    :returns: A :class:`.cache.CacheInfo` of the intern table, or None when
+       interning is disabled.
+    """
+    if _intern_table is None:
+        return None
+    return _intern_table.info()
+
+
+def interning_enabled():
+    """
+    :returns: True if single elements are interned.
+    """
+    return _intern_table is not None
+
+
+def shared(element_class, *args):
+    """
+    :type element_class: type
+    :param element_class: A subclass of :class:`SingleElement`.
+
+    :param args: The positional arguments to create the element with.
+
+    :returns: The interned `element_class(*args)`, or a new one when
+       interning is disabled.
+    """
+    if _intern_table is None:
+        return element_class(*args)
+    args = element_class._intern_args(*args)
+    key = (element_class,) + args
+    element = _intern_table.get(key)
+    if element is None:
+        element = element_class(*args)
+        _intern_table.put(key, element)
+    return element
+
+
+# The optional fields of `Element.__init__`, in the order of its arguments.
+_OPTIONAL_FIELDS = (
+    'first_bis_number', 'first_bis_letter', 'first_bus_number',
+    'first_bus_letter', 'last_house_number', 'last_bis_number',
+    'last_bis_letter', 'last_bus_number', 'last_bus_letter',
+)
+
 
 class Element:
     """
@@ -8,7 +114,27 @@ class Element:
 
     This is an abstract superclass for all output of the housenumparser.reader
     This can be a house number, a house number series, readingerror, etc.
+
+    To keep elements small, every class defines `__slots__` with only the
+    fields it uses. All other fields read as -1. The element classes of this
+    module assign their slots in their own `__init__`, which is faster than
+    the generic one of this class.
     """
+    __slots__ = ('first_house_number',)
+
+    # Per class, (slot, index of its argument) of the optional fields of
+    # `__init__` which the class has a slot for.
+    _init_slots = ()
+
+    first_bis_number = -1
+    first_bis_letter = -1
+    first_bus_number = -1
+    first_bus_letter = -1
+    last_house_number = -1
+    last_bis_number = -1
+    last_bis_letter = -1
+    last_bus_number = -1
+    last_bus_letter = -1
 
     def __init__(self, first_house_number, first_bis_number=-1,
                  first_bis_letter=-1, first_bus_number=-1, first_bus_letter=-1,
@@ -46,15 +172,23 @@ class Element:
         :param last_bus_letter: Last bus letter of the series.
         """
         self.first_house_number = first_house_number
-        self.first_bis_number = first_bis_number
-        self.first_bis_letter = first_bis_letter
-        self.first_bus_number = first_bus_number
-        self.first_bus_letter = first_bus_letter
-        self.last_house_number = last_house_number
-        self.last_bis_number = last_bis_number
-        self.last_bis_letter = last_bis_letter
-        self.last_bus_number = last_bus_number
-        self.last_bus_letter = last_bus_letter
+        # Only the fields a subclass actually uses have a slot, the others
+        # keep the class level default of -1.
+        if self._init_slots:
+            values = (first_bis_number, first_bis_letter, first_bus_number,
+                      first_bus_letter, last_house_number, last_bis_number,
+                      last_bis_letter, last_bus_number, last_bus_letter)
+            for name, index in self._init_slots:
+                setattr(self, name, values[index])
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        slots = set()
+        for klass in cls.__mro__:
+            slots.update(klass.__dict__.get('__slots__', ()))
+        cls._init_slots = tuple((name, index)
+                                for index, name in enumerate(_OPTIONAL_FIELDS)
+                                if name in slots)
 
     @property
     def house_number(self):
@@ -68,6 +202,7 @@ class ReadException(Element):
     """
     Class for a reading error in housenumparser.reader.
     """
+    __slots__ = ('error', 'data', 'on_exc')
 
     class Action(Enum):
         """
@@ -79,7 +214,7 @@ class ReadException(Element):
         DROP = 4  # The error will be ignored, and not exist in the output.
 
     def __init__(self, error, data="", on_exc=Action.ERROR_MSG):
-        super().__init__(-1)
+        self.first_house_number = -1
         self.error = error
         self.data = data
         self.on_exc = on_exc
@@ -87,6 +222,9 @@ class ReadException(Element):
     def split(self):
         return [self]
 
+    def iter_split(self):
+        yield self
+
     def __str__(self):
         if self.on_exc == ReadException.Action.KEEP_ORIGINAL:
             return self.data
@@ -98,7 +236,122 @@ class ReadException(Element):
 class SequenceElement(Element):
     """
     Abstract class of all series of house numbers.
+
+    Subclasses describe their single elements by a :class:`range` of values
+    (letters are stored as their `ord`) through `_range`, and convert between
+    such a value and a :class:`SingleElement` with `_element` and `_value`.
+    """
+    __slots__ = ()
+
+    def split(self):
+        """
+        :returns: A list of :class:`SingleElement`
+        """
+        return list(self.view())
+
+    def iter_split(self):
+        """
+        :returns: An iterator of :class:`SingleElement`
+        """
+        return iter(self.view())
+
+    def view(self):
+        """
+        :returns: A lazy :class:`SequenceView` on the single elements of this
+           series.
+        """
+        return SequenceView(self)
+
+    def _range(self):
+        """
+        :returns: A :class:`range` of the values in this series.
+        """
+        raise NotImplementedError()
+
+    def _element(self, value):
+        """
+        :returns: The :class:`SingleElement` of this series for `value`.
+        """
+        raise NotImplementedError()
+
+    def _element_key(self, value):
+        """
+        :returns: A tuple (class, *args) to create `_element(value)` with.
+        """
+        raise NotImplementedError()
+
+    def _shared_element(self, value):
+        """
+        :returns: `_element(value)` from the intern table.
+        """
+        return shared(*self._element_key(value))
+
+    def _value(self, element):
+        """
+        :returns: The value of `element` within this series, or None if it
+           can never be part of it.
+        """
+        raise NotImplementedError()
+
+
+class SequenceView(collections.abc.Sequence):
     """
+    A read-only view on the single elements of a :class:`SequenceElement`.
+
+    The view is backed by a :class:`range`, so `len()`, `in`, indexing and
+    slicing don't expand the series. Elements are only created on access.
+
+    eg: `BusNumber(23, 4) in BusNumberSequence(23, 1, 3000).view()`
+    """
+    __slots__ = ('sequence', 'values')
+
+    def __init__(self, sequence, values=None):
+        """
+        :type sequence: SequenceElement
+        :param sequence: The series to view.
+
+        :type values: range
+        :param values: Subrange of the values of the series. Default None,
+           meaning all values.
+        """
+        self.sequence = sequence
+        self.values = sequence._range() if values is None else values
+
+    def _factory(self):
+        if _intern_table is None:
+            return self.sequence._element
+        return self.sequence._shared_element
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return SequenceView(self.sequence, self.values[index])
+        return self._factory()(self.values[index])
+
+    def __iter__(self):
+        return map(self._factory(), self.values)
+
+    def __reversed__(self):
+        return map(self._factory(), reversed(self.values))
+
+    def __contains__(self, element):
+        value = self.sequence._value(element)
+        return value is not None and value in self.values
+
+    def index(self, element, start=0, stop=None):
+        if element in self:
+            index = self.values.index(self.sequence._value(element))
+            if index in range(len(self))[start:stop]:
+                return index
+        raise ValueError(f'{element} is not in view')
+
+    def count(self, element):
+        return int(element in self)
+
+    def __repr__(self):
+        return f'<SequenceView {self.sequence} {self.values}>'
 
 
 class HouseNumberSequence(SequenceElement):
@@ -109,6 +362,8 @@ class HouseNumberSequence(SequenceElement):
     - "33, 34, 35, 36" -> "33-36"
     - "32, 33, 34, 35, 36"-> "32, 33-36"
     """
+    __slots__ = ('last_house_number', 'step')
+
     regex = re.compile(r'^(\d+)-(\d+)$')
 
     def __init__(self, first_house_number, last_house_number, step=None):
@@ -124,9 +379,8 @@ class HouseNumberSequence(SequenceElement):
         """
         self.step = step or self._default_step(first_house_number,
                                                last_house_number)
-        super().__init__(
-            first_house_number, last_house_number=last_house_number
-        )
+        self.first_house_number = first_house_number
+        self.last_house_number = last_house_number
         if self.first_house_number > self.last_house_number:
             raise ValueError('Incorrect range')
 
@@ -149,13 +403,20 @@ class HouseNumberSequence(SequenceElement):
                 .format(first_house=self.first_house_number,
                         last_house=self.last_house_number))
 
-    def split(self):
-        """
-         :returns: A list of :class:`HouseNumber`
-        """
-        return [HouseNumber(number) for number
-                in range(self.first_house_number, self.last_house_number + 1,
-                         self.step)]
+    def _range(self):
+        return range(self.first_house_number, self.last_house_number + 1,
+                     self.step)
+
+    def _element(self, value):
+        return HouseNumber(value)
+
+    def _element_key(self, value):
+        return HouseNumber, value
+
+    def _value(self, element):
+        if isinstance(element, HouseNumber):
+            return element.house_number
+        return None
 
 
 class BisNumberSequence(SequenceElement):
@@ -164,6 +425,8 @@ class BisNumberSequence(SequenceElement):
 
     eg: "33/1, 32/2, 33/3" -> "33/1-3"
     """
+    __slots__ = ('first_bis_number', 'last_bis_number', 'original_string')
+
     regex = re.compile(r'^(\d+)[/_](\d+)-(\d+)$')
 
     def __init__(self, house_number, first_bis_number, last_bis_number, original_string):
@@ -180,10 +443,9 @@ class BisNumberSequence(SequenceElement):
         :type original_string: str
         :param original_string: Original string
         """
-        super().__init__(
-            house_number, first_bis_number=first_bis_number,
-            last_bis_number=last_bis_number
-        )
+        self.first_house_number = house_number
+        self.first_bis_number = first_bis_number
+        self.last_bis_number = last_bis_number
         self.original_string = original_string
         if self.first_bis_number > self.last_bis_number:
             raise ValueError('Incorrect range')
@@ -200,20 +462,28 @@ class BisNumberSequence(SequenceElement):
                             first_bis=self.first_bis_number,
                             last_bis=self.last_bis_number))
 
-    def split(self):
-        """
-        :returns: A list of :class:`BisNumber`
-        """
-        return [
-            BisNumber(self.house_number, bis_number, self.original_string)
-            for bis_number in range(self.first_bis_number, self.last_bis_number + 1)
-        ]
+    def _range(self):
+        return range(self.first_bis_number, self.last_bis_number + 1)
+
+    def _element(self, value):
+        return BisNumber(self.house_number, value, self.original_string)
+
+    def _element_key(self, value):
+        return BisNumber, self.house_number, value, self.original_string
+
+    def _value(self, element):
+        if (isinstance(element, BisNumber)
+                and element.house_number == self.house_number):
+            return element.bis_number
+        return None
 
 
 class BisLetterSequence(SequenceElement):
     """
     A series of bis letters.
     """
+    __slots__ = ('first_bis_letter', 'last_bis_letter')
+
     regex = re.compile(r'^(\d+)/?([a-zA-Z]+)-([a-zA-Z]+)$')
 
     def __init__(self, house_number, first_bis_letter, last_bis_letter):
@@ -227,10 +497,9 @@ class BisLetterSequence(SequenceElement):
         :type last_bis_letter: str
         :param last_bis_letter: Last letter of the series.
         """
-        super().__init__(
-            house_number, first_bis_letter=first_bis_letter,
-            last_bis_letter=last_bis_letter
-        )
+        self.first_house_number = house_number
+        self.first_bis_letter = first_bis_letter
+        self.last_bis_letter = last_bis_letter
         start = ord(self.first_bis_letter)
         end = ord(self.last_bis_letter)
         if start > end:
@@ -242,14 +511,21 @@ class BisLetterSequence(SequenceElement):
                         first_letter=self.first_bis_letter,
                         last_letter=self.last_bis_letter))
 
-    def split(self):
-        """
-        :returns: A list of :class:`BisLetter`
-        """
-        start = ord(self.first_bis_letter)
-        end = ord(self.last_bis_letter)
-        return [BisLetter(self.house_number, chr(i)) for i
-                in range(start, end + 1)]
+    def _range(self):
+        return range(ord(self.first_bis_letter),
+                     ord(self.last_bis_letter) + 1)
+
+    def _element(self, value):
+        return BisLetter(self.house_number, chr(value))
+
+    def _element_key(self, value):
+        return BisLetter, self.house_number, chr(value)
+
+    def _value(self, element):
+        if (isinstance(element, BisLetter)
+                and element.house_number == self.house_number):
+            return ord(element.bis_letter)
+        return None
 
 
 class BusNumberSequence(SequenceElement):
@@ -258,6 +534,8 @@ class BusNumberSequence(SequenceElement):
 
     eg: "33 bus 1, 32 bus 2, 33 bus 3" -> "33 bus 1-3"
     """
+    __slots__ = ('first_bus_number', 'last_bus_number')
+
     regex = re.compile(r'^(\d+)bus(\d+)-(\d+)$')
 
     def __init__(self, house_number, first_bus_number, last_bus_number):
@@ -271,10 +549,9 @@ class BusNumberSequence(SequenceElement):
         :type last_bus_number: int
         :param last_bus_number: Last number of the series.
         """
-        super().__init__(
-            house_number, first_bus_number=first_bus_number,
-            last_bus_number=last_bus_number
-        )
+        self.first_house_number = house_number
+        self.first_bus_number = first_bus_number
+        self.last_bus_number = last_bus_number
         if self.first_bus_number > self.last_bus_number:
             raise ValueError('Incorrect range')
 
@@ -284,12 +561,20 @@ class BusNumberSequence(SequenceElement):
                         first_bus=self.first_bus_number,
                         last_bus=self.last_bus_number))
 
-    def split(self):
-        """
-        :returns: A list of :class:`BusNumber`
-        """
-        return [BusNumber(self.house_number, bus_number) for bus_number
-                in range(self.first_bus_number, self.last_bus_number + 1)]
+    def _range(self):
+        return range(self.first_bus_number, self.last_bus_number + 1)
+
+    def _element(self, value):
+        return BusNumber(self.house_number, value)
+
+    def _element_key(self, value):
+        return BusNumber, self.house_number, value
+
+    def _value(self, element):
+        if (isinstance(element, BusNumber)
+                and element.house_number == self.house_number):
+            return element.bus_number
+        return None
 
 
 class BusLetterSequence(SequenceElement):
@@ -298,6 +583,8 @@ class BusLetterSequence(SequenceElement):
 
     eg: "33 bus A, 32 bus B, 33 bus C" -> "33 bus A-C"
     """
+    __slots__ = ('first_bus_letter', 'last_bus_letter')
+
     regex = re.compile(r'^(\d+)bus([a-zA-Z]+)-([a-zA-Z]+)$')
 
     def __init__(self, house_number, first_bus_letter, last_bus_letter):
@@ -311,10 +598,9 @@ class BusLetterSequence(SequenceElement):
         :type last_bus_letter: str
         :param last_bus_letter: Last letter of the series.
         """
-        super().__init__(
-            house_number, first_bus_letter=first_bus_letter,
-            last_bus_letter=last_bus_letter
-        )
+        self.first_house_number = house_number
+        self.first_bus_letter = first_bus_letter
+        self.last_bus_letter = last_bus_letter
         start = ord(self.first_bus_letter)
         end = ord(self.last_bus_letter)
         if start > end:
@@ -326,31 +612,60 @@ class BusLetterSequence(SequenceElement):
                         first_letter=self.first_bus_letter,
                         last_letter=self.last_bus_letter))
 
-    def split(self):
-        """
-        :returns: A list of :class:`BusLetter`
-        """
-        return [BusLetter(self.house_number, chr(i)) for i
-                in range(ord(self.first_bus_letter),
-                         ord(self.last_bus_letter) + 1)]
+    def _range(self):
+        return range(ord(self.first_bus_letter),
+                     ord(self.last_bus_letter) + 1)
+
+    def _element(self, value):
+        return BusLetter(self.house_number, chr(value))
+
+    def _element_key(self, value):
+        return BusLetter, self.house_number, chr(value)
+
+    def _value(self, element):
+        if (isinstance(element, BusLetter)
+                and element.house_number == self.house_number):
+            return ord(element.bus_letter)
+        return None
 
 
 class SingleElement(Element):
     """
     An abstract superclass for house numbers.
     """
+    __slots__ = ()
+
+    @classmethod
+    def _intern_args(cls, *args):
+        """
+        :returns: The arguments to create an interned element with, which
+           are also its key in the intern table.
+        """
+        return args
 
     def split(self):
         return [self]
 
+    def iter_split(self):
+        yield self
+
 
 class HouseNumber(SingleElement):
     """
     A simple house number. eg: 13 or 15.
     """
+    __slots__ = ()
+
     sequence_class = HouseNumberSequence
     regex = re.compile(r'^(\d+)$')
 
+    def __init__(self, house_number):
+        """
+        :type house_number: int
+        :param house_number: House number
+        """
+        self.first_house_number = house_number
+
     def __str__(self):
         return str(self.house_number)
 
@@ -361,6 +676,8 @@ class BisNumber(SingleElement):
 
     eg: "3/1" or "21/5"
     """
+    __slots__ = ('first_bis_number', 'original_string')
+
     sequence_class = BisNumberSequence
     regex = re.compile(r'^(\d+)[/_](\d+)$')
 
@@ -375,12 +692,16 @@ class BisNumber(SingleElement):
         :type original_string: str
         :param bis_number: Original string
         """
-        super().__init__(
-            house_number,
-            first_bis_number=bis_number,
-        )
+        self.first_house_number = house_number
+        self.first_bis_number = bis_number
         self.original_string = original_string
 
+    @classmethod
+    def _intern_args(cls, house_number, bis_number, original_string):
+        separator = '_' if '_' in original_string else '/'
+        return (house_number, bis_number,
+                f'{house_number}{separator}{bis_number}')
+
     @property
     def bis_number(self):
         return self.first_bis_number
@@ -400,6 +721,8 @@ class BusNumber(SingleElement):
 
     eg: "3 bus 1" or "53 bus 5"
     """
+    __slots__ = ('first_bus_number',)
+
     sequence_class = BusNumberSequence
     regex = re.compile(r'^(\d+)bus(\d+)$')
 
@@ -411,7 +734,8 @@ class BusNumber(SingleElement):
         :type bus_number: int
         :param bus_number: Bus number
         """
-        super().__init__(house_number, first_bus_number=bus_number)
+        self.first_house_number = house_number
+        self.first_bus_number = bus_number
 
     @property
     def bus_number(self):
@@ -428,6 +752,8 @@ class BusLetter(SingleElement):
 
     eg: "3 bus A" or "53 bus D"
     """
+    __slots__ = ('first_bus_letter',)
+
     sequence_class = BusLetterSequence
     regex = re.compile(r'^(\d+)bus([a-zA-Z])$')
 
@@ -439,7 +765,8 @@ class BusLetter(SingleElement):
         :type bus_letter: str
         :param bus_letter: Bus letter
         """
-        super().__init__(house_number, first_bus_letter=bus_letter)
+        self.first_house_number = house_number
+        self.first_bus_letter = bus_letter
 
     @property
     def bus_letter(self):
@@ -456,6 +783,8 @@ class BisLetter(SingleElement):
 
     eg: "3A" or "53D"
     """
+    __slots__ = ('first_bis_letter',)
+
     sequence_class = BisLetterSequence
     regex = re.compile(r'^(\d+)[/_]?([a-zA-Z])$')
 
@@ -467,7 +796,8 @@ class BisLetter(SingleElement):
         :type bis_letter: str
         :param bis_letter: Bis letter
         """
-        super().__init__(house_number, first_bis_letter=bis_letter)
+        self.first_house_number = house_number
+        self.first_bis_letter = bis_letter
 
     @property
     def bis_letter(self):
@@ -0,0 +1,62 @@
+"""
+Module which keeps house numbers merged while they are added and removed.
+
+eg:
+    merger = Merger('1-9, 4 bus 1-30')
+    merger.add('11')
+    merger.remove('4 bus 7')
+    merger.elements() -> ['1-11', '4 bus 1-6', '4 bus 8-30']
+"""
+
+from housenumparser import ranges
+from housenumparser.element import ReadException
+from housenumparser.sets import HouseNumberSet
+
+
+class Merger(HouseNumberSet):
+    """
+    A changing collection of house numbers, which can return its contents
+    merged into sequences at any time.
+
+    A :class:`.sets.HouseNumberSet` which caches the merged series per
+    element type and house number until the numbers of that house change.
+    The merged result follows the same rules as :func:`.merger.merge_data`,
+    and includes the incorrect data.
+    """
+
+    def __init__(self, data=None, step=None,
+                 on_exc=ReadException.Action.ERROR_MSG):
+        """
+        See :class:`.sets.HouseNumberSet` for the parameters.
+        """
+        # (kind, house number) -> list of runs, see RangeSet.runs.
+        self._runs = {}
+        super().__init__(data, step=step, on_exc=on_exc)
+
+    def _changed(self, key):
+        self._runs.pop(key, None)
+
+    def runs(self):
+        """
+        :returns: An iterator of (kind, house number, first, last) tuples,
+           see :meth:`.sets.HouseNumberSet.runs`.
+        """
+        for kind, key in ranges.sorted_keys(self._ranges):
+            runs = self._runs.get((kind, key))
+            if runs is None:
+                runs = self._runs[kind, key] = list(
+                    self._ranges[kind, key].runs(kind.allowed_steps)
+                )
+            for first, last in runs:
+                yield kind, key, first, last
+
+    def elements(self):
+        """
+        :returns: A list of :class:`.element.SingleElement` and if possible
+           :class:`.element.SequenceElement`, ordered by element type and
+           house number, followed by the incorrect data.
+        """
+        return super().elements() + self.bad_data
+
+    def __iter__(self):
+        return iter(self.elements())
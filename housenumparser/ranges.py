@@ -0,0 +1,658 @@
+"""
+Module with range based sets of numbers, used to work with house number
+series without expanding them into single numbers.
+
+eg:
+- "1-99" -> the odd numbers 1 up to 99, stored as 1 interval
+- "4 bus 1-3000" -> the bus numbers 1 up to 3000 of house 4, as 2 intervals
+"""
+
+import bisect
+import collections
+import heapq
+
+from housenumparser import merger
+from housenumparser import reader
+from housenumparser.element import BisNumber
+from housenumparser.element import Element
+from housenumparser.element import HouseNumber
+from housenumparser.element import ReadException
+from housenumparser.element import SequenceElement
+from housenumparser.merger import KINDS
+from housenumparser.merger import Kind  # noqa
+
+
+class IntervalList:
+    """
+    A set of integers, stored as a sorted list of disjoint closed intervals.
+
+    Adjacent intervals are joined, so every set has exactly one
+    representation. Adding or removing an interval takes a binary search.
+
+    Used as is for the kinds of elements which only merge series with step 1,
+    see :func:`number_set`.
+    """
+    __slots__ = ('starts', 'ends')
+
+    def __init__(self, intervals=()):
+        """
+        :type intervals: Iterable[tuple[int, int]]
+        :param intervals: (first, last) tuples to add.
+        """
+        self.starts = []
+        self.ends = []
+        for first, last in intervals:
+            self.add(first, last)
+
+    def add(self, first, last=None, step=1):
+        """
+        Adds all integers from `first` up to and including `last`.
+
+        :type last: int
+        :param last: Default None, meaning just `first`.
+
+        :type step: int
+        :param step: Step between the integers. Default 1. Only series with
+           step 1 are stored as an interval.
+        """
+        if last is None:
+            last = first
+        if step != 1:
+            for number in range(first, last + 1, step):
+                self.add(number)
+            return
+        if first > last:
+            return
+        # Intervals which overlap with or are adjacent to [first, last].
+        start = bisect.bisect_left(self.ends, first - 1)
+        stop = bisect.bisect_right(self.starts, last + 1)
+        if start < stop:
+            first = min(first, self.starts[start])
+            last = max(last, self.ends[stop - 1])
+        self.starts[start:stop] = [first]
+        self.ends[start:stop] = [last]
+
+    def remove(self, first, last=None, step=1):
+        """
+        Removes all integers from `first` up to and including `last`. See
+        :meth:`add` for the parameters.
+        """
+        if last is None:
+            last = first
+        if step != 1:
+            for number in range(first, last + 1, step):
+                self.remove(number)
+            return
+        if first > last:
+            return
+        # Intervals which overlap with [first, last].
+        start = bisect.bisect_left(self.ends, first)
+        stop = bisect.bisect_right(self.starts, last)
+        if start >= stop:
+            return
+        starts = []
+        ends = []
+        if self.starts[start] < first:
+            starts.append(self.starts[start])
+            ends.append(first - 1)
+        if self.ends[stop - 1] > last:
+            starts.append(last + 1)
+            ends.append(self.ends[stop - 1])
+        self.starts[start:stop] = starts
+        self.ends[start:stop] = ends
+
+    def intervals(self):
+        """
+        :returns: An iterator of (first, last) tuples, in ascending order.
+        """
+        return zip(self.starts, self.ends)
+
+    def runs(self, allowed_steps):
+        """
+        Like :meth:`RangeSet.runs`. With only step 1 allowed, the runs are
+        the intervals themselves.
+        """
+        if set(allowed_steps) == {1}:
+            return self.intervals()
+        numbers = RangeSet()
+        for first, last in self.intervals():
+            numbers.add(first, last)
+        return numbers.runs(allowed_steps)
+
+    def copy(self):
+        result = IntervalList()
+        result.starts = self.starts[:]
+        result.ends = self.ends[:]
+        return result
+
+    def union(self, other):
+        result = self.copy()
+        for first, last in other.intervals():
+            result.add(first, last)
+        return result
+
+    def intersection(self, other):
+        result = IntervalList()
+        i = j = 0
+        while i < len(self.starts) and j < len(other.starts):
+            first = max(self.starts[i], other.starts[j])
+            last = min(self.ends[i], other.ends[j])
+            if first <= last:
+                result.starts.append(first)
+                result.ends.append(last)
+            if self.ends[i] < other.ends[j]:
+                i += 1
+            else:
+                j += 1
+        return result
+
+    def difference(self, other):
+        result = self.copy()
+        for first, last in other.intervals():
+            result.remove(first, last)
+        return result
+
+    def issubset(self, other):
+        for first, last in self.intervals():
+            index = bisect.bisect_right(other.starts, first) - 1
+            if index < 0 or other.ends[index] < last:
+                return False
+        return True
+
+    def __contains__(self, number):
+        index = bisect.bisect_right(self.starts, number) - 1
+        return index >= 0 and self.ends[index] >= number
+
+    def __len__(self):
+        return sum(self.ends) - sum(self.starts) + len(self.starts)
+
+    def __bool__(self):
+        return bool(self.starts)
+
+    def __iter__(self):
+        for first, last in self.intervals():
+            yield from range(first, last + 1)
+
+    def __eq__(self, other):
+        if not isinstance(other, IntervalList):
+            return NotImplemented
+        return self.starts == other.starts and self.ends == other.ends
+
+    def __repr__(self):
+        return f'<IntervalList {list(self.intervals())}>'
+
+
+class RangeSet:
+    """
+    A set of integers which can store series with step 1 and step 2 as
+    ranges.
+
+    Even and odd numbers are kept apart, each in an :class:`IntervalList`
+    over `number // 2`. A series with step 2 then is one interval of its
+    parity, and a series with step 1 one interval of both.
+    """
+    __slots__ = ('parts',)
+
+    def __init__(self):
+        # The even and the odd numbers.
+        self.parts = (IntervalList(), IntervalList())
+
+    @staticmethod
+    def _halves(first, last, step):
+        """
+        :returns: An iterator of (parity, first, last) tuples, the intervals
+           of the numbers of `range(first, last + 1, step)` per parity.
+        """
+        if step == 1:
+            parities = (0, 1)
+        elif step == 2:
+            parities = (first % 2,)
+        else:
+            # No ranges possible, fall back to the single numbers.
+            for number in range(first, last + 1, step):
+                yield number % 2, number // 2, number // 2
+            return
+        for parity in parities:
+            yield parity, (first - parity + 1) // 2, (last - parity) // 2
+
+    def add(self, first, last=None, step=1):
+        """
+        Adds the numbers of a series.
+
+        :type first: int
+        :param first: First number of the series.
+
+        :type last: int
+        :param last: Last number of the series. Default None, meaning just
+           `first`.
+
+        :type step: int
+        :param step: Step between the numbers. Default 1. Only series with
+           step 1 or 2 are stored as ranges.
+        """
+        if last is None:
+            last = first
+        for parity, first_half, last_half in self._halves(first, last, step):
+            self.parts[parity].add(first_half, last_half)
+
+    def remove(self, first, last=None, step=1):
+        """
+        Removes the numbers of a series. See :meth:`add` for the parameters.
+        """
+        if last is None:
+            last = first
+        for parity, first_half, last_half in self._halves(first, last, step):
+            self.parts[parity].remove(first_half, last_half)
+
+    def segments(self):
+        """
+        :returns: An iterator of (first, last) tuples in ascending order, each
+           describing the numbers from first to last with step 2.
+        """
+        even, odd = self.parts
+        return heapq.merge(
+            ((2 * first, 2 * last) for first, last in even.intervals()),
+            ((2 * first + 1, 2 * last + 1) for first, last in odd.intervals())
+        )
+
+    def _next(self, number, parities=(0, 1)):
+        """
+        :returns: The smallest number in the set larger than `number`, of one
+           of the given `parities`, or None.
+        """
+        result = None
+        for parity in parities:
+            part = self.parts[parity]
+            half = (number - parity) // 2 + 1
+            index = bisect.bisect_left(part.ends, half)
+            if index < len(part.ends):
+                candidate = 2 * max(part.starts[index], half) + parity
+                if result is None or candidate < result:
+                    result = candidate
+        return result
+
+    def _segment_last(self, number):
+        """
+        :returns: The last number of the segment (see :meth:`segments`)
+           which contains `number`.
+        """
+        parity = number % 2
+        part = self.parts[parity]
+        index = bisect.bisect_right(part.starts, number // 2) - 1
+        return 2 * part.ends[index] + parity
+
+    def runs(self, allowed_steps):
+        """
+        Merges the numbers into series, with the same outcome as
+        :func:`.merger.merge_numbers`.
+
+        Every series is found with a few binary searches, so the numbers are
+        never expanded.
+
+        :type allowed_steps: tuple
+        :param allowed_steps: steps allowed between 2 elements to be in a
+           sequence
+
+        :returns: An iterator of (first, last) tuples. For single numbers,
+           first and last are equal.
+        """
+        if set(allowed_steps) not in ({1}, {1, 2}):
+            yield from _merge_numbers(list(self), allowed_steps)
+            return
+        merge_odd_runs = 2 in allowed_steps
+        first = min((2 * part.starts[0] + parity
+                     for parity, part in enumerate(self.parts) if part),
+                    default=None)
+        while first is not None:
+            second = self._next(first)
+            step = None if second is None else second - first
+            if step not in allowed_steps:
+                yield first, first
+                first = second
+            elif step == 1:
+                # Odd and even numbers alternate up to the end of the shortest
+                # of both segments, and one further.
+                last = min(self._segment_last(first),
+                           self._segment_last(second)) + 1
+                if merge_odd_runs and (last - first) % 2 == 0:
+                    # Same as merge_numbers: 1-5 would be read as 1,3,5.
+                    yield first, last - 1
+                    first = last
+                else:
+                    yield first, last
+                    first = self._next(last)
+            else:
+                # The series with step 2 stops at the end of its segment, or
+                # right before a number of the other parity.
+                last = self._segment_last(first)
+                other = self._next(first, parities=(1 - first % 2,))
+                if other is not None and other < last:
+                    last = other - 1
+                yield first, last
+                first = self._next(last)
+
+    def copy(self):
+        result = RangeSet()
+        result.parts = tuple(part.copy() for part in self.parts)
+        return result
+
+    def union(self, other):
+        result = RangeSet()
+        result.parts = tuple(mine.union(theirs)
+                             for mine, theirs in zip(self.parts, other.parts))
+        return result
+
+    def intersection(self, other):
+        result = RangeSet()
+        result.parts = tuple(mine.intersection(theirs)
+                             for mine, theirs in zip(self.parts, other.parts))
+        return result
+
+    def difference(self, other):
+        result = RangeSet()
+        result.parts = tuple(mine.difference(theirs)
+                             for mine, theirs in zip(self.parts, other.parts))
+        return result
+
+    def issubset(self, other):
+        return all(mine.issubset(theirs)
+                   for mine, theirs in zip(self.parts, other.parts))
+
+    def __contains__(self, number):
+        return number // 2 in self.parts[number % 2]
+
+    def __len__(self):
+        return len(self.parts[0]) + len(self.parts[1])
+
+    def __bool__(self):
+        return bool(self.parts[0]) or bool(self.parts[1])
+
+    def __iter__(self):
+        even, odd = self.parts
+        return heapq.merge((2 * half for half in even),
+                           (2 * half + 1 for half in odd))
+
+    def __eq__(self, other):
+        if not isinstance(other, RangeSet):
+            return NotImplemented
+        return self.parts == other.parts
+
+    def __repr__(self):
+        return f'<RangeSet {list(self.segments())}>'
+
+
+def number_set(kind):
+    """
+    :type kind: :class:`.merger.Kind`
+    :param kind: The kind of element.
+
+    :returns: An empty set for the numbers of one house number of `kind`: an
+       :class:`IntervalList` if only series with step 1 are allowed, a
+       :class:`RangeSet` otherwise.
+    """
+    if set(kind.allowed_steps) == {1}:
+        return IntervalList()
+    return RangeSet()
+
+
+def _merge_numbers(numbers, allowed_steps, order=merger.InputOrder.SORTED):
+    """
+    :returns: The result of :func:`.merger.merge_numbers` on `numbers`, by
+       default ascending and unique, as (first, last) tuples.
+    """
+    return merger.merge_numbers(numbers, lambda number: (number, number),
+                                lambda first, last: (first, last),
+                                allowed_steps, order=order)
+
+
+_KIND_INDEX = {kind: index for index, kind in enumerate(KINDS)}
+
+_KINDS_BY_CLASS = {}
+for _kind in KINDS:
+    _KINDS_BY_CLASS[_kind.single_class] = _kind
+    _KINDS_BY_CLASS[_kind.sequence_class] = _kind
+
+
+def bounds(element):
+    """
+    Describes a single or sequence element as a series of numbers.
+
+    :type element: Union[.element.SingleElement, .element.SequenceElement]
+    :param element: The element.
+
+    :returns: A tuple (kind, key, first, last, step). The key is the house
+       number, or None for house numbers themselves.
+    """
+    kind = _KINDS_BY_CLASS[type(element)]
+    key = None if kind.single_class is HouseNumber else element.house_number
+    if isinstance(element, SequenceElement):
+        values = element._range()
+        return kind, key, values.start, values[-1], values.step
+    value = kind.value(element)
+    return kind, key, value, value, 1
+
+
+def build(kind, key, first, last, original_string=''):
+    """
+    The opposite of :func:`bounds`, for a run as returned by
+    :meth:`RangeSet.runs`.
+
+    :returns: A single element if first equals last, a sequence otherwise.
+    """
+    if first == last:
+        return kind.single(key, first, original_string)
+    return kind.sequence(key, first, last, original_string)
+
+
+def read(data, step=None, on_exc=ReadException.Action.ERROR_MSG):
+    """
+    :type data: Union[str, .element.Element, list]
+    :param data: A label, an element, or a list of those.
+
+    :type step: int
+    :param step: Amount of house numbers per step when reading series.
+       See :func:`housenumparser.split`.
+
+    :type on_exc: :class:`.element.ReadException.Action`
+    :param on_exc: Flag on how to treat incorrect data. Default ERROR_MSG.
+
+    :returns: An iterator of the :class:`.element.Element` in `data`, with
+       series kept as they are.
+    """
+    if isinstance(data, Element):
+        return iter((data,))
+    if isinstance(data, list):
+        return (element for item in data
+                for element in read(item, step=step, on_exc=on_exc))
+    return reader.iter_read_data(data, step=step, on_exc=on_exc)
+
+
+def add_element(numbers, original_strings, element):
+    """
+    Adds the numbers of a single or sequence element.
+
+    :type numbers: dict
+    :param numbers: (kind, house number or None for house numbers) -> set of
+       numbers, see :func:`number_set`. Missing sets are created.
+
+    :type original_strings: dict
+    :param original_strings: House number -> original string of its last
+       added bis number, updated for bis numbers.
+
+    :type element: Union[.element.SingleElement, .element.SequenceElement]
+    :param element: The element.
+
+    :returns: The (kind, house number) key of the changed set.
+    """
+    kind, key, first, last, step = bounds(element)
+    rangeset = numbers.get((kind, key))
+    if rangeset is None:
+        rangeset = numbers[kind, key] = number_set(kind)
+    rangeset.add(first, last, step)
+    if kind.single_class is BisNumber:
+        original_strings[key] = element.original_string
+    return kind, key
+
+
+def remove_element(numbers, element):
+    """
+    Removes the numbers of a single or sequence element, and the set of its
+    house number once empty. See :func:`add_element`.
+
+    :returns: The (kind, house number) key of the changed set, or None if
+       there was no set for it.
+    """
+    kind, key, first, last, step = bounds(element)
+    rangeset = numbers.get((kind, key))
+    if rangeset is None:
+        return None
+    rangeset.remove(first, last, step)
+    if not rangeset:
+        del numbers[kind, key]
+    return kind, key
+
+
+def sorted_keys(numbers):
+    """
+    :type numbers: dict
+    :param numbers: See :func:`add_element`.
+
+    :returns: A list of the (kind, house number) keys of `numbers`, ordered
+       by element type and house number, like :func:`merge_buckets`.
+    """
+    return sorted(numbers, key=lambda key: (_KIND_INDEX[key[0]], key[1] or 0))
+
+
+RangeBuckets = collections.namedtuple(
+    'RangeBuckets', ['numbers', 'series', 'original_strings', 'bad_data']
+)
+RangeBuckets.__doc__ = """
+Elements sorted by :func:`bucket`.
+
+- numbers: like :class:`.merger.Buckets`, the single numbers per house number
+  of every kind, with an empty list for house numbers with only series.
+- series: a dictionary per kind, of house number -> set of the series of
+  that house number, see :func:`number_set`.
+- original_strings: house number -> original string of its last bis number.
+- bad_data: list of :class:`.element.ReadException`.
+"""
+
+
+def bucket(elements):
+    """
+    Sorts single and sequence elements by type and house number, without
+    expanding the sequences. Single elements are sorted by
+    :func:`.merger.bucket`, sequences are kept in a set of ranges per kind
+    and house number.
+
+    :type elements: Iterable[.element.Element]
+    :param elements: Elements as returned by :func:`read`.
+
+    :returns: A :class:`RangeBuckets`.
+    """
+    series = tuple({} for _ in KINDS)
+
+    def add_series(element):
+        kind, key, first, last, step = bounds(element)
+        index = _KIND_INDEX[kind]
+        rangeset = series[index].get(key)
+        if rangeset is None:
+            rangeset = series[index][key] = number_set(kind)
+        rangeset.add(first, last, step)
+        return index, key
+
+    numbers, original_strings, bad_data = merger.bucket(
+        elements, add_series=add_series
+    )
+    return RangeBuckets(numbers, series, original_strings, bad_data)
+
+
+def bucket_runs(buckets, order=merger.InputOrder.UNSORTED):
+    """
+    Merges the numbers and series of every type and house number, with the
+    same outcome as :func:`.merger.merge_buckets` on the expanded numbers.
+
+    Only series are kept as ranges: house numbers with just single numbers
+    are merged like :func:`.merger.merge_numbers` does, which is faster for
+    those.
+
+    :type buckets: :class:`RangeBuckets`
+    :param buckets: data as returned by :func:`bucket`
+
+    :type order: :class:`.merger.InputOrder`
+    :param order: What is known about the order of the single numbers per
+       type and house number, used for house numbers without series. See
+       :func:`.merger.merge_numbers`. Default UNSORTED.
+
+    :returns: An iterator of (kind, house number, first, last) tuples, like
+       :meth:`.sets.HouseNumberSet.runs`, in the order of :func:`merge_buckets`.
+    """
+    for kind, per_house, series in zip(KINDS, buckets.numbers,
+                                       buckets.series):
+        for key, values in per_house.items():
+            rangeset = series.get(key)
+            if rangeset is None:
+                runs = _merge_numbers(values, kind.allowed_steps,
+                                      order=order)
+            else:
+                for value in values:
+                    rangeset.add(value)
+                runs = rangeset.runs(kind.allowed_steps)
+            for first, last in runs:
+                yield kind, key, first, last
+
+
+def merge_buckets(buckets, on_exc=ReadException.Action.ERROR_MSG,
+                  order=merger.InputOrder.UNSORTED):
+    """
+    Creates the elements of the runs of :func:`bucket_runs`.
+
+    :type buckets: :class:`RangeBuckets`
+    :param buckets: data as returned by :func:`bucket`
+
+    :type on_exc: :class:`.element.ReadException.Action`
+    :param on_exc: Flag on how to treat incorrect data. Default ERROR_MSG.
+
+    :type order: :class:`.merger.InputOrder`
+    :param order: See :func:`bucket_runs`.
+
+    :returns: A list of :class:`.element.SingleElement` and if possible
+       :class:`.element.SequenceElement`.
+    """
+    original_strings = buckets.original_strings
+    merged_data = [
+        build(kind, key, first, last, original_strings.get(key, ''))
+        for kind, key, first, last in bucket_runs(buckets, order=order)
+    ]
+    # raise wouldn't have reached this point, drop needs no action.
+    if on_exc in (ReadException.Action.ERROR_MSG,
+                  ReadException.Action.KEEP_ORIGINAL):
+        merged_data.extend(buckets.bad_data)
+    return merged_data
+
+
+def merge(data, step=None, on_exc=ReadException.Action.ERROR_MSG,
+          order=merger.InputOrder.UNSORTED):
+    """
+    Merges house numbers into series like :func:`housenumparser.merge`, but
+    without expanding the series in `data`: the cost depends on the amount
+    of series, not on the amount of house numbers they describe.
+
+    :type data: Union[str, .element.Element, list]
+    :param data: A label, an element, or a list of those.
+
+    :type step: int
+    :param step: Amount of house numbers per step when reading series.
+       See :func:`housenumparser.split`.
+
+    :type on_exc: :class:`.element.ReadException.Action`
+    :param on_exc: Flag on how to treat incorrect data. Default ERROR_MSG.
+
+    :type order: :class:`.merger.InputOrder`
+    :param order: See :func:`bucket_runs`.
+
+    :returns: A list of :class:`.element.SingleElement` and if possible
+       :class:`.element.SequenceElement`.
+    """
+    return merge_buckets(bucket(read(data, step=step, on_exc=on_exc)),
+                         on_exc=on_exc, order=order)
@@ -8,8 +8,12 @@ eg:
 - "25-27" -> [<HouseNumberSequence> "25-26", <HouseNumber> "27"]
 """
 
+import collections
+import mmap
 import re
 
+from housenumparser import stats
+from housenumparser.cache import LRUCache
 from housenumparser.element import BisLetter
 from housenumparser.element import BisLetterSequence
 from housenumparser.element import BisNumber
@@ -21,6 +25,263 @@ from housenumparser.element import BusNumberSequence
 from housenumparser.element import HouseNumber
 from housenumparser.element import HouseNumberSequence
 from housenumparser.element import ReadException
+from housenumparser.element import SingleElement
+from housenumparser.element import interning_enabled
+from housenumparser.element import shared
+
+# Element classes in order of precedence: when a string matches the regex of
+# more than one class, the first one in this list wins.
+ELEMENT_CLASSES = (
+    BusNumberSequence, BusLetterSequence, BisNumberSequence,
+    BisLetterSequence, BusNumber, BusLetter, BisNumber, BisLetter,
+    HouseNumberSequence, HouseNumber
+)
+
+_WHITESPACE = re.compile(r'\s')
+_DIGITS = '0123456789'
+
+# Every element starts with a house number.
+_HOUSE_NUMBER_PATTERN = r'(\d+)'
+
+_Rule = collections.namedtuple(
+    '_Rule', ['element_class', 'start', 'stop', 'converters', 'takes_step',
+              'takes_original_string']
+)
+
+
+def _compile_grammar(element_classes):
+    """
+    Combines the regexes of all element classes into a single regex.
+
+    The house number all elements start with is matched once, followed by an
+    alternation with a named group per class for the remainder of its
+    pattern. This way one `match` both classifies the string and captures the
+    arguments. As the alternatives are tried from left to right, the
+    precedence of `element_classes` is kept.
+
+    :type element_classes: tuple
+    :param element_classes: Element classes, in order of precedence.
+
+    :returns: A tuple (compiled regex, dict of group name -> `_Rule`).
+    """
+    alternatives = []
+    rules = {}
+    index = 1  # Group 1 is the house number.
+    for element_class in element_classes:
+        pattern = element_class.regex.pattern.lstrip('^').rstrip('$')
+        if not pattern.startswith(_HOUSE_NUMBER_PATTERN):
+            raise ValueError(f'{element_class.__name__} does not start with '
+                             f'a house number: {pattern}')
+        pattern = pattern[len(_HOUSE_NUMBER_PATTERN):]
+        name = element_class.__name__
+        alternatives.append(f'(?P<{name}>{pattern})')
+        # Digit groups become ints, everything else (letters) stays a str.
+        converters = tuple(
+            int if group == r'\d+' else str
+            for group in re.findall(r'\(([^()]*)\)', pattern)
+        )
+        index += 1  # The named group itself.
+        rules[name] = _Rule(
+            element_class=element_class,
+            start=index,
+            stop=index + len(converters),
+            converters=converters,
+            takes_step=element_class is HouseNumberSequence,
+            takes_original_string=(element_class is BisNumber
+                                   or element_class is BisNumberSequence),
+        )
+        index += len(converters)
+    regex = re.compile(
+        '^' + _HOUSE_NUMBER_PATTERN + '(?:' + '|'.join(alternatives) + ')$'
+    )
+    return regex, rules
+
+
+_GRAMMAR, _RULES = _compile_grammar(ELEMENT_CLASSES)
+
+_NEWLINE = re.compile(rb'\n')
+_BUFFER_TYPES = (bytes, bytearray, memoryview, mmap.mmap)
+
+_NO_KWARGS = {}
+
+DEFAULT_CACHE_SIZE = 10000
+
+# Cache of `_parse` results, see `configure_cache`. Disabled by default.
+_parse_cache = None
+_NOT_CACHED = object()
+
+
+def _parse(stripped_data, step):
+    """
+    Classifies a house number element string, without creating the element.
+
+    :type stripped_data: str
+    :param stripped_data: A house number element without any whitespace.
+
+    :type step: int
+    :param step: Amount of house numbers per step. See :func:`read_data`.
+
+    :returns: A tuple (element class, args, kwargs) to create the element
+       with, or None if the string isn't understood.
+    """
+    if stripped_data.isdecimal():
+        # Shortcut for the most common input: a plain house number.
+        return HouseNumber, (int(stripped_data),), _NO_KWARGS
+    match = _GRAMMAR.match(stripped_data)
+    if not match:
+        return None
+    rule = _RULES[match.lastgroup]
+    groups = match.groups()
+    args = [int(groups[0])]
+    args.extend(convert(group) for convert, group
+                in zip(rule.converters, groups[rule.start:rule.stop]))
+    kwargs = {}
+    if rule.takes_step:
+        kwargs['step'] = step
+    if rule.takes_original_string:
+        kwargs['original_string'] = stripped_data
+    return rule.element_class, tuple(args), kwargs
+
+
+def _scan(data, step):
+    """
+    Classifies a house number element string like :func:`_parse`, but by
+    walking the string with :class:`str` methods instead of the regex.
+
+    Whitespace is skipped where it occurs, so a stripped copy of the string
+    is only made when there is whitespace inside. Strings with non-ASCII
+    characters (eg. digits of other scripts) are left to :func:`_parse`.
+
+    :type data: str
+    :param data: A house number element, possibly with whitespace.
+
+    :type step: int
+    :param step: Amount of house numbers per step. See :func:`read_data`.
+
+    :returns: A tuple (element class, args, kwargs) to create the element
+       with, or None if the string isn't understood.
+    """
+    if data.isdecimal():
+        return HouseNumber, (int(data),), _NO_KWARGS
+    if not data.isascii():
+        return _parse(_WHITESPACE.sub('', data), step)
+    if ' ' in data or not data.isprintable():
+        # All other ASCII whitespace is unprintable.
+        data = ''.join(data.split())
+        if data.isdecimal():
+            return HouseNumber, (int(data),), _NO_KWARGS
+    rest = data.lstrip(_DIGITS)
+    if len(rest) == len(data):
+        return None
+    house_number = int(data[:len(data) - len(rest)])
+    first = rest[0]
+    if first == '-':
+        last = rest[1:]
+        if last.isdigit():
+            return (HouseNumberSequence, (house_number, int(last)),
+                    {'step': step})
+        return None
+    if first == '/' or first == '_':
+        value = rest[1:]
+        low, dash, high = value.partition('-')
+        if dash:
+            if low.isdigit() and high.isdigit():
+                return (BisNumberSequence, (house_number, int(low), int(high)),
+                        {'original_string': data})
+            if first == '/' and low.isalpha() and high.isalpha():
+                return BisLetterSequence, (house_number, low, high), _NO_KWARGS
+        elif value.isdigit():
+            return (BisNumber, (house_number, int(value)),
+                    {'original_string': data})
+        elif len(value) == 1 and value.isalpha():
+            return BisLetter, (house_number, value), _NO_KWARGS
+        return None
+    if rest.startswith('bus'):
+        value = rest[3:]
+        if value.isdigit():
+            return BusNumber, (house_number, int(value)), _NO_KWARGS
+        if len(value) == 1 and value.isalpha():
+            return BusLetter, (house_number, value), _NO_KWARGS
+        low, dash, high = value.partition('-')
+        if dash:
+            if low.isdigit() and high.isdigit():
+                return (BusNumberSequence, (house_number, int(low), int(high)),
+                        _NO_KWARGS)
+            if low.isalpha() and high.isalpha():
+                return (BusLetterSequence, (house_number, low, high),
+                        _NO_KWARGS)
+        # Otherwise 'bus' can still be the start of bis letters: '25bus-C'.
+    low, dash, high = rest.partition('-')
+    if dash:
+        if low.isalpha() and high.isalpha():
+            return BisLetterSequence, (house_number, low, high), _NO_KWARGS
+    elif len(rest) == 1 and rest.isalpha():
+        return BisLetter, (house_number, rest), _NO_KWARGS
+    return None
+
+
+# Parse function used by `read_element`, see `configure_engine`.
+_engine = _parse
+
+ENGINES = {
+    'regex': _parse,
+    'scanner': _scan,
+}
+
+
+def configure_engine(engine='regex'):
+    """
+    Selects how :func:`read_element` classifies element strings. Both
+    engines give identical results.
+
+    - 'regex': strips all whitespace, then matches a single regex combining
+      the regexes of all element classes. The default.
+    - 'scanner': walks the string with :class:`str` methods, which is
+      faster for most input.
+
+    :type engine: str
+    :param engine: A key of `ENGINES`. Default 'regex'.
+    """
+    global _engine
+    if engine not in ENGINES:
+        raise ValueError(f'Unknown engine: {engine}')
+    _engine = ENGINES[engine]
+
+
+def configure_cache(maxsize=DEFAULT_CACHE_SIZE):
+    """
+    Enables, resizes or disables the cache of :func:`read_element`.
+
+    Address data is very repetitive, so with the cache enabled the outcome of
+    parsing a (whitespace-stripped) element string and step is remembered.
+    Only the classification is cached: every call still returns a new
+    element, so callers can't affect each other by changing one.
+
+    :type maxsize: int
+    :param maxsize: Maximum amount of cached element strings. When `None` or
+       0, the cache is disabled. Default `DEFAULT_CACHE_SIZE`.
+    """
+    global _parse_cache
+    _parse_cache = LRUCache(maxsize) if maxsize else None
+
+
+def clear_cache():
+    """
+    Empties the cache of :func:`read_element` and resets its statistics.
+    """
+    if _parse_cache is not None:
+        _parse_cache.clear()
+
+
+def cache_info():
+    """
+    :returns: A :class:`.cache.CacheInfo` with the hits, misses, evictions,
+       maxsize and current size of the cache of :func:`read_element`, or None
+       when the cache is disabled.
+    """
+    if _parse_cache is None:
+        return None
+    return _parse_cache.info()
 
 
 def read_data(data, step=None, on_exc=ReadException.Action.ERROR_MSG):
@@ -41,8 +302,52 @@ def read_data(data, step=None, on_exc=ReadException.Action.ERROR_MSG):
 
     :returns: A list from of the data.
     """
-    return read_iterable(str(data).split(","), step=step,
-                         on_exc=on_exc)
+    return list(iter_read_data(data, step=step, on_exc=on_exc))
+
+
+def iter_read_data(data, step=None, on_exc=ReadException.Action.ERROR_MSG):
+    """
+    Generator variant of :func:`read_data`.
+
+    :type data: str
+    :param data: A :class:`str` with comma-seperated house numbers
+
+    :type step: int
+    :param step: Amount of house numbers per step. See :func:`read_data`.
+
+    :type on_exc: .element.ReadException.Action
+    :param on_exc: Flag on how to treat incorrect data. Default ERROR_MSG.
+
+    :returns: A generator of :class:`.element.Element`.
+    """
+    if isinstance(data, _BUFFER_TYPES):
+        return iter_read_bytes(data, step=step, on_exc=on_exc)
+    inputs = str(data).split(",")
+    if (_engine is _scan and _parse_cache is None
+            and stats.collector is None and not interning_enabled()):
+        return _iter_scan(inputs, step, on_exc)
+    return iter_read_iterable(inputs, step=step, on_exc=on_exc)
+
+
+def _iter_scan(inputs, step, on_exc):
+    """
+    :func:`iter_read_iterable` for the scanner engine, without the cache,
+    statistics and interning. Elements are created right here, only incorrect
+    data goes through :func:`read_element`.
+    """
+    for data in inputs:
+        data = data.strip()
+        parsed = _scan(data, step)
+        if parsed is None:
+            element = read_element(data, step=step, on_exc=on_exc)
+        else:
+            element_class, args, kwargs = parsed
+            try:
+                element = element_class(*args, **kwargs)
+            except ValueError:
+                element = read_element(data, step=step, on_exc=on_exc)
+        if element is not None:
+            yield element
 
 
 def read_iterable(inputs, step=None, on_exc=ReadException.Action.ERROR_MSG):
@@ -63,13 +368,220 @@ def read_iterable(inputs, step=None, on_exc=ReadException.Action.ERROR_MSG):
 
     :returns: A list of :class:`.element.Element`.
     """
-    result = []
+    return list(iter_read_iterable(inputs, step=step, on_exc=on_exc))
+
+
+def iter_read_iterable(inputs, step=None,
+                       on_exc=ReadException.Action.ERROR_MSG):
+    """
+    Generator variant of :func:`read_iterable`. The inputs are consumed
+    lazily, one element string at a time.
+
+    :type inputs: Iterable[str]
+    :param inputs: House numbers and/or house number series.
+
+    :type step: int
+    :param step: Amount of house numbers per step. See :func:`read_data`.
+
+    :type on_exc: .element.ReadException.Action
+    :param on_exc: Flag on how to treat incorrect data. Default ERROR_MSG.
+
+    :returns: A generator of :class:`.element.Element`.
+    """
     for data in inputs:
         data = data.strip() if data else str(data)
         parsed_element = read_element(data, step=step, on_exc=on_exc)
         if parsed_element is not None:
-            result.append(parsed_element)
-    return result
+            yield parsed_element
+
+
+def read_bytes(data, step=None, on_exc=ReadException.Action.ERROR_MSG,
+               encoding='utf-8'):
+    """
+    Parses comma-seperated house number elements in a bytes-like object,
+    like :func:`read_data` does for a :class:`str`.
+
+    :type data: Union[bytes, bytearray, memoryview, mmap.mmap]
+    :param data: A buffer with comma-seperated house numbers.
+
+    :type step: int
+    :param step: Amount of house numbers per step. See :func:`read_data`.
+
+    :type on_exc: .element.ReadException.Action
+    :param on_exc: Flag on how to treat incorrect data. Default ERROR_MSG.
+
+    :type encoding: str
+    :param encoding: Encoding of `data`. Default 'utf-8'. Bytes which can't
+       be decoded end up in the incorrect data.
+
+    :returns: A list of :class:`.element.Element`, the same as
+       :func:`read_data` on the decoded data.
+    """
+    return list(iter_read_bytes(data, step=step, on_exc=on_exc,
+                                encoding=encoding))
+
+
+def iter_read_bytes(data, step=None, on_exc=ReadException.Action.ERROR_MSG,
+                    encoding='utf-8', start=0, end=None):
+    """
+    Generator variant of :func:`read_bytes`.
+
+    Only `data[start:end]` is decoded, so a label can be read from a large
+    buffer without copying the rest.
+
+    :type start: int
+    :param start: Offset in `data` to start reading at. Default 0.
+
+    :type end: int
+    :param end: Offset in `data` to stop reading at. Default None, the end
+       of `data`.
+
+    See :func:`read_bytes` for the other parameters.
+
+    :returns: A generator of :class:`.element.Element`.
+    """
+    if end is None:
+        end = len(data)
+    text = str(data[start:end], encoding, 'replace')
+    return iter_read_data(text, step=step, on_exc=on_exc)
+
+
+def iter_read_lines(data, step=None, on_exc=ReadException.Action.ERROR_MSG,
+                    encoding='utf-8'):
+    """
+    Reads a buffer with a label per line, eg. a memory-mapped file.
+
+    eg:
+        with open(path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                for offset, elements in iter_read_lines(data):
+                    ...
+
+    :type data: Union[bytes, bytearray, memoryview, mmap.mmap]
+    :param data: A buffer with a label per line.
+
+    See :func:`read_bytes` for the other parameters.
+
+    :returns: A generator of tuples (offset of the line in `data`, list of
+       :class:`.element.Element` of the line).
+    """
+    position = 0
+    end = len(data)
+    while position < end:
+        newline = _NEWLINE.search(data, position, end)
+        line_end = end if newline is None else newline.start()
+        yield position, list(iter_read_bytes(
+            data, step=step, on_exc=on_exc, encoding=encoding,
+            start=position, end=line_end
+        ))
+        position = line_end + 1
+
+
+_NOT_UNDERSTOOD = 'Could not parse/understand'
+_INCORRECT_RANGE = 'Incorrect range'
+
+# Sequence class -> indexes of its first and last value in the parsed args.
+_RANGE_ARGS = {
+    HouseNumberSequence: (0, 1),
+    BisNumberSequence: (1, 2),
+    BisLetterSequence: (1, 2),
+    BusNumberSequence: (1, 2),
+    BusLetterSequence: (1, 2),
+}
+
+TokenError = collections.namedtuple(
+    'TokenError', ['index', 'offset', 'token', 'reason']
+)
+TokenError.__doc__ = """
+An element string which can't be read, see :func:`validate`.
+
+- index: position of the element string in the label, counting from 0.
+- offset: position of its first character in the label, 0 for lists.
+- token: the element string, without surrounding whitespace.
+- reason: the message :func:`read_element` would give, eg. 'Incorrect range'.
+"""
+
+Validation = collections.namedtuple('Validation', ['valid', 'errors'])
+Validation.__doc__ = """
+The outcome of :func:`validate`: `valid` is True when `errors`, a list of
+:class:`TokenError`, is empty.
+"""
+
+
+def check_element(data):
+    """
+    Checks whether a single house number element string can be read, without
+    creating the element.
+
+    The same ranges are rejected as the element classes reject. Letter series
+    with more than one letter per end, which the element classes can't
+    handle at all, are reported as not understood.
+
+    :type data: str
+    :param data: A String representating a house number.
+
+    :returns: None if `data` can be read, otherwise the reason why not.
+    """
+    parse = _engine
+    parsed = parse(_WHITESPACE.sub('', data) if parse is _parse else data,
+                   None)
+    if parsed is None:
+        return _NOT_UNDERSTOOD
+    indexes = _RANGE_ARGS.get(parsed[0])
+    if indexes is None:
+        return None
+    args = parsed[1]
+    first = args[indexes[0]]
+    last = args[indexes[1]]
+    if isinstance(first, str) and (len(first) != 1 or len(last) != 1):
+        return _NOT_UNDERSTOOD
+    if first > last:
+        return _INCORRECT_RANGE
+    return None
+
+
+def validate(data):
+    """
+    Checks which element strings of a label can be read, without creating
+    elements or expanding series.
+
+    :type data: Union[str, list[str]]
+    :param data: A comma-seperated :class:`str` of house numbers, or a list
+       of house number element strings.
+
+    :returns: A :class:`Validation`.
+    """
+    errors = []
+    if isinstance(data, str):
+        offset = 0
+        for index, token in enumerate(data.split(',')):
+            if not token.isdecimal():
+                reason = check_element(token.strip())
+                if reason is not None:
+                    errors.append(TokenError(
+                        index, offset + len(token) - len(token.lstrip()),
+                        token.strip(), reason
+                    ))
+            offset += len(token) + 1
+    else:
+        for index, token in enumerate(data):
+            token = token.strip() if token else str(token)
+            reason = check_element(token)
+            if reason is not None:
+                errors.append(TokenError(index, 0, token, reason))
+    return Validation(not errors, errors)
+
+
+def validate_many(labels):
+    """
+    :func:`validate` for every label.
+
+    :type labels: Iterable[Union[str, list[str]]]
+    :param labels: labels as accepted by :func:`validate`
+
+    :returns: A list of :class:`Validation`, in the order of `labels`.
+    """
+    return [validate(label) for label in labels]
 
 
 def read_element(data, step=None, on_exc=ReadException.Action.ERROR_MSG):
@@ -91,30 +603,40 @@ def read_element(data, step=None, on_exc=ReadException.Action.ERROR_MSG):
     :returns: A :class:`.element.Element` OR an exception in case of
        incorrect data.
     """
-    element_classes = [BusNumberSequence, BusLetterSequence, BisNumberSequence,
-                       BisLetterSequence, BusNumber, BusLetter, BisNumber,
-                       BisLetter, HouseNumberSequence, HouseNumber]
-    stripped_data = re.sub(r'\s', '', data)
+    parse = _engine
+    # The scanner skips whitespace itself.
+    text = _WHITESPACE.sub('', data) if parse is _parse else data
     exception = None
     try:
-        for element_class in element_classes:
-            match = element_class.regex.match(stripped_data)
-            if match:
-                args = [int(group) if group.isdigit() else group
-                        for group in match.groups()]
-                kwargs = {}
-                if element_class == HouseNumberSequence:
-                    kwargs['step'] = step
-                if element_class in [BisNumber, BisNumberSequence]:
-                    kwargs['original_string'] = stripped_data
-                return element_class(*args, **kwargs)
+        if _parse_cache is None:
+            parsed = parse(text, step)
+        else:
+            key = (text, step)
+            parsed = _parse_cache.get(key, _NOT_CACHED)
+            if parsed is _NOT_CACHED:
+                parsed = parse(text, step)
+                _parse_cache.put(key, parsed)
+        if parsed is not None:
+            element_class, args, kwargs = parsed
+            if (interning_enabled()
+                    and issubclass(element_class, SingleElement)):
+                # The keyword arguments of single elements (the original
+                # string of a BisNumber) are also their last positional ones.
+                result = shared(element_class, *args, *kwargs.values())
+            else:
+                result = element_class(*args, **kwargs)
+            if stats.collector is not None:
+                stats.collector.record_element(element_class)
+            return result
     except ValueError as e:
         exception = e
+    if stats.collector is not None:
+        stats.collector.record_element(ReadException)
     if on_exc == ReadException.Action.RAISE:
         if exception:
             msg = str(exception)
         else:
-            msg = "Could not parse/understand"
+            msg = _NOT_UNDERSTOOD
         raise ValueError(msg + ': ' + data)
     elif on_exc == ReadException.Action.DROP:
         return None
@@ -123,6 +645,6 @@ def read_element(data, step=None, on_exc=ReadException.Action.ERROR_MSG):
         if exception:
             msg = str(exception)
         else:
-            msg = "Could not parse/understand"
+            msg = _NOT_UNDERSTOOD
         return ReadException(msg, data=data, on_exc=on_exc)
     raise ValueError("Not implemented on_exc: " + str(on_exc))
@@ -0,0 +1,294 @@
+"""
+Module with a set of house numbers which works on ranges.
+
+eg:
+    permit = HouseNumberSet('1-99, 4 bus 1-3000')
+    register = HouseNumberSet('5-9, 4 bus 12-2000')
+    register <= permit -> True
+    (permit - register).elements() -> ['1-3', '11-99', '4 bus 1-11',
+                                       '4 bus 2001-3000']
+"""
+
+from housenumparser import ranges
+from housenumparser.element import ReadException
+
+
+class HouseNumberSet:
+    """
+    A set of single house numbers, bis numbers, bis letters, bus numbers and
+    bus letters.
+
+    The numbers are kept in a set of ranges (see :func:`.ranges.number_set`)
+    per element type and per house number, so series (including those with
+    step 2) are stored, compared and combined as ranges, without expanding
+    them.
+
+    Bis numbers are compared by number: '3/1' and '3_1' are the same. The
+    notation of the last added bis number of a house is used for output.
+    Incorrect data is kept in `bad_data`, but isn't part of the set.
+    """
+
+    def __init__(self, data=None, step=None,
+                 on_exc=ReadException.Action.ERROR_MSG):
+        """
+        :type data: Union[str, list[str], list[.element.Element]]
+        :param data: Initial house numbers. Default None.
+
+        :type step: int
+        :param step: Amount of house numbers per step when reading series.
+           See :func:`housenumparser.split`.
+
+        :type on_exc: :class:`.element.ReadException.Action`
+        :param on_exc: Flag on how to treat incorrect data. Default ERROR_MSG.
+        """
+        self.on_exc = on_exc
+        # (kind, house number or None for house numbers) -> ranges.number_set.
+        self._ranges = {}
+        # House number -> original string of its last added bis number.
+        self._original_strings = {}
+        self.bad_data = []
+        if data is not None:
+            self.add(data, step=step)
+
+    @classmethod
+    def _from_ranges(cls, numbers, original_strings, on_exc):
+        result = cls(on_exc=on_exc)
+        result._ranges = {key: rangeset for key, rangeset in numbers.items()
+                          if rangeset}
+        result._original_strings = original_strings
+        return result
+
+    def add(self, data, step=None):
+        """
+        Adds house numbers.
+
+        :type data: Union[str, list[str], .element.Element]
+        :param data: A label, or element(s).
+
+        :type step: int
+        :param step: Amount of house numbers per step when reading series.
+           See :func:`housenumparser.split`.
+        """
+        for element in ranges.read(data, step=step, on_exc=self.on_exc):
+            if isinstance(element, ReadException):
+                self.bad_data.append(element)
+            else:
+                self._changed(ranges.add_element(
+                    self._ranges, self._original_strings, element
+                ))
+
+    def remove(self, data, step=None):
+        """
+        Removes house numbers. Numbers which aren't present are ignored, as
+        is incorrect data.
+
+        :type data: Union[str, list[str], .element.Element]
+        :param data: A label, or element(s).
+
+        :type step: int
+        :param step: Amount of house numbers per step when reading series.
+           See :func:`housenumparser.split`.
+        """
+        for element in ranges.read(data, step=step, on_exc=self.on_exc):
+            if not isinstance(element, ReadException):
+                self._changed(ranges.remove_element(self._ranges, element))
+
+    def _changed(self, key):
+        """
+        Called by :meth:`add` and :meth:`remove` after changing the numbers
+        of a (kind, house number) key, or with None if nothing changed.
+        """
+
+    def _coerce(self, other):
+        if isinstance(other, HouseNumberSet):
+            return other
+        return HouseNumberSet(other, on_exc=self.on_exc)
+
+    def union(self, other):
+        """
+        :type other: Union[HouseNumberSet, str, list]
+        :param other: A set, or anything :meth:`add` accepts.
+
+        :returns: A new :class:`HouseNumberSet` with the numbers of both.
+        """
+        other = self._coerce(other)
+        numbers = {key: rangeset.copy()
+                   for key, rangeset in self._ranges.items()}
+        for key, rangeset in other._ranges.items():
+            mine = numbers.get(key)
+            numbers[key] = (rangeset.copy() if mine is None
+                            else mine.union(rangeset))
+        return self._from_ranges(
+            numbers, {**other._original_strings, **self._original_strings},
+            self.on_exc
+        )
+
+    def intersection(self, other):
+        """
+        :returns: A new :class:`HouseNumberSet` with the numbers in both.
+           See :meth:`union`.
+        """
+        other = self._coerce(other)
+        numbers = {key: rangeset.intersection(other._ranges[key])
+                   for key, rangeset in self._ranges.items()
+                   if key in other._ranges}
+        return self._from_ranges(numbers, dict(self._original_strings),
+                                 self.on_exc)
+
+    def difference(self, other):
+        """
+        :returns: A new :class:`HouseNumberSet` with the numbers which are
+           not in `other`. See :meth:`union`.
+        """
+        other = self._coerce(other)
+        numbers = {}
+        for key, rangeset in self._ranges.items():
+            theirs = other._ranges.get(key)
+            numbers[key] = (rangeset.copy() if theirs is None
+                            else rangeset.difference(theirs))
+        return self._from_ranges(numbers, dict(self._original_strings),
+                                 self.on_exc)
+
+    def symmetric_difference(self, other):
+        """
+        :returns: A new :class:`HouseNumberSet` with the numbers in exactly
+           one of both. See :meth:`union`.
+        """
+        other = self._coerce(other)
+        return self.difference(other).union(other.difference(self))
+
+    def issubset(self, other):
+        """
+        :returns: True if every number is also in `other`.
+           See :meth:`union`.
+        """
+        other = self._coerce(other)
+        for key, rangeset in self._ranges.items():
+            theirs = other._ranges.get(key)
+            if theirs is None or not rangeset.issubset(theirs):
+                return False
+        return True
+
+    def issuperset(self, other):
+        """
+        :returns: True if every number of `other` is also in this set.
+           See :meth:`union`.
+        """
+        return self._coerce(other).issubset(self)
+
+    def isdisjoint(self, other):
+        """
+        :returns: True if no number is in both. See :meth:`union`.
+        """
+        return not self.intersection(other)
+
+    def copy(self):
+        return self._from_ranges(
+            {key: rangeset.copy() for key, rangeset in self._ranges.items()},
+            dict(self._original_strings), self.on_exc
+        )
+
+    def runs(self):
+        """
+        :returns: An iterator of (kind, house number, first, last) tuples,
+           the merged series as :meth:`elements` returns them. See
+           :meth:`.ranges.RangeSet.runs` and :class:`.ranges.Kind`.
+        """
+        for kind, key in ranges.sorted_keys(self._ranges):
+            for first, last in self._ranges[kind, key].runs(
+                    kind.allowed_steps):
+                yield kind, key, first, last
+
+    def elements(self):
+        """
+        :returns: A list of :class:`.element.SingleElement` and if possible
+           :class:`.element.SequenceElement`, merged like
+           :func:`housenumparser.merge` and ordered by element type and house
+           number.
+        """
+        return [ranges.build(kind, key, first, last,
+                             self._original_strings.get(key, ''))
+                for kind, key, first, last in self.runs()]
+
+    def __iter__(self):
+        """
+        :returns: An iterator of :class:`.element.SingleElement`, ordered by
+           element type, house number and number.
+        """
+        for kind, key in ranges.sorted_keys(self._ranges):
+            original_string = self._original_strings.get(key, '')
+            for value in self._ranges[kind, key]:
+                yield kind.single(key, value, original_string)
+
+    def __contains__(self, element):
+        """
+        :type element: Union[.element.Element, str]
+        :param element: A single or sequence element, or a label.
+
+        :returns: True if all its numbers are in the set.
+        """
+        if not isinstance(element, HouseNumberSet):
+            element = HouseNumberSet(element, on_exc=self.on_exc)
+            if element.bad_data:
+                return False
+        return element.issubset(self)
+
+    def __len__(self):
+        """
+        :returns: The amount of single house numbers.
+        """
+        return sum(len(rangeset) for rangeset in self._ranges.values())
+
+    def __bool__(self):
+        return bool(self._ranges)
+
+    def __eq__(self, other):
+        if not isinstance(other, HouseNumberSet):
+            return NotImplemented
+        return self._ranges == other._ranges
+
+    __hash__ = None
+
+    def __le__(self, other):
+        if not isinstance(other, HouseNumberSet):
+            return NotImplemented
+        return self.issubset(other)
+
+    def __lt__(self, other):
+        if not isinstance(other, HouseNumberSet):
+            return NotImplemented
+        return self != other and self.issubset(other)
+
+    def __ge__(self, other):
+        if not isinstance(other, HouseNumberSet):
+            return NotImplemented
+        return other.issubset(self)
+
+    def __gt__(self, other):
+        if not isinstance(other, HouseNumberSet):
+            return NotImplemented
+        return self != other and other.issubset(self)
+
+    def __or__(self, other):
+        if not isinstance(other, HouseNumberSet):
+            return NotImplemented
+        return self.union(other)
+
+    def __and__(self, other):
+        if not isinstance(other, HouseNumberSet):
+            return NotImplemented
+        return self.intersection(other)
+
+    def __sub__(self, other):
+        if not isinstance(other, HouseNumberSet):
+            return NotImplemented
+        return self.difference(other)
+
+    def __xor__(self, other):
+        if not isinstance(other, HouseNumberSet):
+            return NotImplemented
+        return self.symmetric_difference(other)
+
+    def __repr__(self):
+        label = ', '.join(str(element) for element in self.elements())
+        return f'<{type(self).__name__} {label!r}>'
@@ -0,0 +1,154 @@
+"""
+Module with opt-in statistics on parsing and merging.
+
+eg:
+    collector = stats.enable()
+    housenumparser.split('1-9, 4 bus 1-30, foo')
+    collector.elements -> Counter({'HouseNumberSequence': 1,
+                                   'BusNumberSequence': 1,
+                                   'ReadException': 1})
+    collector.expansions -> Counter({'BusNumberSequence': 30,
+                                     'HouseNumberSequence': 5})
+    stats.disable()
+
+:func:`housenumparser.merge` keeps series as ranges, so it records no
+expansions, only the timings of its stages.
+
+While disabled, which is the default, the only cost is a check of
+`collector` against None in the instrumented functions. Statistics of work
+done in other processes, eg. by :func:`housenumparser.split_many`, are not
+collected.
+"""
+
+import collections
+import contextlib
+import threading
+import time
+
+
+class Stats:
+    """
+    Collects counters and timings of the instrumented functions.
+
+    To forward the statistics to another metrics system, either read them
+    with :meth:`as_dict`, or subclass this class and override the `record_`
+    methods.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """
+        Sets all counters and timings back to zero.
+        """
+        with self._lock:
+            # Element class name -> amount of elements read.
+            self.elements = collections.Counter()
+            # Sequence class name -> amount of single elements split into.
+            self.expansions = collections.Counter()
+            # Stage -> amount of calls and total seconds.
+            self.calls = collections.Counter()
+            self.timings = collections.Counter()
+
+    @property
+    def read_exceptions(self):
+        """
+        :returns: The amount of element strings which couldn't be read.
+        """
+        return self.elements['ReadException']
+
+    def record_element(self, element_class):
+        """
+        Called by :func:`.reader.read_element` for every element string,
+        with :class:`.element.ReadException` for incorrect data.
+
+        :type element_class: type
+        :param element_class: The class of the element read.
+        """
+        with self._lock:
+            self.elements[element_class.__name__] += 1
+
+    def record_expansion(self, sequence_class, amount):
+        """
+        Called by :func:`housenumparser.iter_split` for every sequence split.
+
+        :type sequence_class: type
+        :param sequence_class: The class of the sequence.
+
+        :type amount: int
+        :param amount: The amount of single elements in the sequence.
+        """
+        with self._lock:
+            self.expansions[sequence_class.__name__] += amount
+
+    def record_timing(self, stage, seconds):
+        """
+        Called after every stage: 'split' of :func:`housenumparser.split`, and
+        'read', 'group' and 'merge_data' of :func:`housenumparser.merge`.
+
+        :type stage: str
+        :param stage: The name of the stage.
+
+        :type seconds: float
+        :param seconds: The duration of the stage.
+        """
+        with self._lock:
+            self.calls[stage] += 1
+            self.timings[stage] += seconds
+
+    @contextlib.contextmanager
+    def timer(self, stage):
+        """
+        Context manager which records the duration of its body as `stage`.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_timing(stage, time.perf_counter() - start)
+
+    def as_dict(self):
+        """
+        :returns: A dictionary with the counters and timings as plain
+           dictionaries, eg. to export as JSON.
+        """
+        with self._lock:
+            return {
+                'elements': dict(self.elements),
+                'read_exceptions': self.elements['ReadException'],
+                'expansions': dict(self.expansions),
+                'calls': dict(self.calls),
+                'timings': dict(self.timings),
+            }
+
+
+# The active `Stats`, see `enable`. Disabled by default.
+collector = None
+
+
+def enable(instance=None):
+    """
+    Starts collecting statistics.
+
+    :type instance: :class:`Stats`
+    :param instance: The collector to use. Default None, which creates a new
+       :class:`Stats`.
+
+    :returns: The active collector.
+    """
+    global collector
+    collector = Stats() if instance is None else instance
+    return collector
+
+
+def disable():
+    """
+    Stops collecting statistics.
+
+    :returns: The collector which was active, or None.
+    """
+    global collector
+    previous, collector = collector, None
+    return previous
@@ -24,6 +24,14 @@ setup(
     package_dir={'housenumparser': 'housenumparser'},
     include_package_data=True,
     install_requires=requires,
+    extras_require={
+        'numpy': ['numpy'],
+    },
+    entry_points={
+        'console_scripts': [
+            'housenumparser = housenumparser.cli:main',
+        ],
+    },
     license='MIT',
     zip_safe=False,
     classifiers=[
@@ -0,0 +1,172 @@
+import asyncio
+import concurrent.futures
+import threading
+
+import pytest
+
+import housenumparser
+from housenumparser import aio
+from housenumparser import merger
+from housenumparser.element import ReadException
+
+
+def _strings(elements):
+    return [str(element) for element in elements]
+
+
+def test_async_split_and_merge():
+    async def main():
+        return (await housenumparser.async_split('1-5, 4 bus 1-2'),
+                await housenumparser.async_merge('1, 3, 5, 4 bus 1, 4 bus 2'))
+
+    split, merged = asyncio.run(main())
+    assert ['1', '3', '5', '4 bus 1', '4 bus 2'] == _strings(split)
+    assert ['1-5', '4 bus 1-2'] == _strings(merged)
+
+
+def test_async_many_keeps_order():
+    labels = [f'{i}-{i + 4}' for i in range(1, 300)]
+
+    async def source():
+        for label in labels:
+            yield label
+            if len(label) % 3 == 0:
+                await asyncio.sleep(0)
+
+    async def main():
+        with concurrent.futures.ThreadPoolExecutor(3) as executor:
+            split = [result async for result in housenumparser.async_split_many(
+                source(), executor=executor, batch_size=7, max_pending=2
+            )]
+            merged = [result async for result in housenumparser.async_merge_many(
+                labels, executor=executor, batch_size=7
+            )]
+        return split, merged
+
+    split, merged = asyncio.run(main())
+    assert [_strings(x) for x in split] == [
+        _strings(housenumparser.split(label)) for label in labels
+    ]
+    assert [_strings(x) for x in merged] == [
+        _strings(housenumparser.merge(label)) for label in labels
+    ]
+
+
+def test_async_merge_many_order():
+    labels = ['1, 5, 3', '2, 4, 6', '7, 3, 5, 3']
+
+    async def main(order):
+        return [_strings(result) async for result
+                in housenumparser.async_merge_many(labels, order=order)]
+
+    for order in merger.InputOrder:
+        assert asyncio.run(main(order)) == [
+            _strings(housenumparser.merge(label, order=order))
+            for label in labels
+        ]
+    assert asyncio.run(main(merger.InputOrder.SORTED)) != asyncio.run(
+        main(merger.InputOrder.UNSORTED)
+    )
+
+
+def test_async_many_process_pool():
+    labels = ['1-9', '4 bus 1-3', 'foo'] * 10
+
+    async def main():
+        with concurrent.futures.ProcessPoolExecutor(2) as executor:
+            return [_strings(result) async for result
+                    in housenumparser.async_split_many(labels,
+                                                       executor=executor,
+                                                       batch_size=4)]
+
+    assert asyncio.run(main()) == [
+        _strings(housenumparser.split(label)) for label in labels
+    ]
+
+
+def test_backpressure():
+    read = []
+    release = threading.Event()
+
+    def slow_split(label):
+        release.wait()
+        return label
+
+    def source():
+        for i in range(1000):
+            read.append(i)
+            yield str(i)
+
+    async def main():
+        results = aio._map_async(slow_split, source(), None, 5, 2)
+        first = asyncio.ensure_future(results.__anext__())
+        await asyncio.sleep(0.05)
+        # At most 2 batches of 5 in the executor and 2 * 5 in the queue.
+        assert len(read) <= 5 * 2 + 5 * 2 + 1
+        release.set()
+        assert '0' == await first
+        rest = [result async for result in results]
+        assert 999 == len(rest)
+
+    asyncio.run(main())
+
+
+def test_close_cancels():
+    started = []
+
+    def split(label):
+        started.append(label)
+        return label
+
+    async def main():
+        results = aio._map_async(split, (str(i) for i in range(10000)),
+                                 None, 10, 2)
+        assert '0' == await results.__anext__()
+        await results.aclose()
+        count = len(started)
+        await asyncio.sleep(0.05)
+        assert count == len(started)
+        assert count < 10000
+
+    asyncio.run(main())
+
+
+def test_cancel_task():
+    async def source():
+        yield '1'
+        await asyncio.sleep(10)
+
+    async def consume():
+        return [result async for result in housenumparser.async_split_many(
+            source()
+        )]
+
+    async def main():
+        task = asyncio.ensure_future(consume())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+
+
+def test_errors():
+    async def failing_source():
+        yield '1'
+        raise KeyError('source')
+
+    async def main():
+        with pytest.raises(KeyError):
+            async for _ in housenumparser.async_split_many(failing_source()):
+                pass
+        with pytest.raises(ValueError):
+            async for _ in housenumparser.async_merge_many(
+                    ['1', 'foo'], on_exc=ReadException.Action.RAISE):
+                pass
+        with pytest.raises(ValueError):
+            async for _ in housenumparser.async_split_many(['1'],
+                                                           batch_size=0):
+                pass
+
+    asyncio.run(main())
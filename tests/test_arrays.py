@@ -0,0 +1,45 @@
+import pytest
+
+import housenumparser
+from housenumparser.element import ReadException
+
+np = pytest.importorskip('numpy')
+arrays = pytest.importorskip('housenumparser.arrays')
+
+
+def test_split_to_arrays():
+    result = arrays.split_to_arrays(['1-5', '2 bus 1-3, 4, 7/2, 7_3-4',
+                                     '8a, 8 bus b-c'])
+    assert [1, 3, 5, 2, 2, 2, 4, 7, 7, 7, 8, 8, 8] == \
+        result.house_number.tolist()
+    assert [-1] * 7 + [2, 3, 4] + [-1] * 3 == result.bis_number.tolist()
+    assert [-1] * 10 + [ord('a'), -1, -1] == result.bis_letter.tolist()
+    assert [-1] * 3 + [1, 2, 3] + [-1] * 7 == result.bus_number.tolist()
+    assert [-1] * 11 + [ord('b'), ord('c')] == result.bus_letter.tolist()
+    assert [0, 0, 0, 2, 2, 2, 0, 1, 1, 1, 3, 4, 4] == result.kind.tolist()
+    assert [0] * 3 + [1] * 7 + [2] * 3 == result.label_index.tolist()
+    assert ([-1] * 7 + [ord('/'), ord('_'), ord('_')] + [-1] * 3
+            == result.bis_separator.tolist())
+    assert [] == result.errors
+
+
+def test_round_trip():
+    labels = ['25C-F,28-32,29 bus 2-5', '1/1-3, 111_1, 33 bus A-C', '10-12']
+    result = arrays.split_to_arrays(labels, step=1)
+    expected = [str(element) for label in labels
+                for element in housenumparser.split(label, step=1)]
+    assert expected == [str(element) for element
+                        in arrays.arrays_to_elements(result)]
+
+
+def test_errors():
+    result = arrays.split_to_arrays('A, 1, ?')
+    assert [1] == result.house_number.tolist()
+    assert [(0, 'Could not parse/understand: A'),
+            (0, 'Could not parse/understand: ?')] == \
+        [(index, str(error)) for index, error in result.errors]
+    result = arrays.split_to_arrays(['A'], on_exc=ReadException.Action.DROP)
+    assert 0 == len(result.house_number)
+    assert [] == result.errors
+    with pytest.raises(ValueError):
+        arrays.split_to_arrays(['A'], on_exc=ReadException.Action.RAISE)
@@ -0,0 +1,24 @@
+import pytest
+
+from housenumparser.cache import LRUCache
+
+
+def test_lru_cache():
+    cache = LRUCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert 1 == cache.get('a')
+    cache.put('c', 3)
+    assert 'b' not in cache
+    assert cache.get('b') is None
+    assert 3 == cache.get('c', 0)
+    assert 2 == len(cache)
+    assert (2, 1, 1, 2, 2) == tuple(cache.info())
+    cache.clear()
+    assert 0 == len(cache)
+    assert (0, 0, 0, 2, 0) == tuple(cache.info())
+
+
+def test_lru_cache_maxsize():
+    with pytest.raises(ValueError):
+        LRUCache(0)
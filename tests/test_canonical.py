@@ -0,0 +1,69 @@
+import pytest
+
+import housenumparser
+from housenumparser import canonical
+from housenumparser.element import ReadException
+
+
+@pytest.fixture
+def cache():
+    canonical.configure_cache(2)
+    yield
+    canonical.configure_cache(None)
+
+
+@pytest.mark.parametrize('label', ['25,27,29', '25-29', '29, 27 ,25',
+                                   '25-27, 27-29', ['29', '25-27']])
+def test_same_canonical_form(label):
+    assert '25-29' == housenumparser.normalize(label)
+    assert (((0, 0, 25, 29),), ()) == housenumparser.canonical_key(label)
+
+
+def test_order_and_notation():
+    label = '7 bus 2, 3_1-2, 5 bus 1, 3A, 2, 1, 7 bus 1, 3/3'
+    assert '1-2, 3/1-3, 5 bus 1, 7 bus 1-2, 3A' == (
+        housenumparser.normalize(label)
+    )
+    assert housenumparser.canonical_key(label) == (
+        housenumparser.canonical_key('1-2, 3A, 3/1-3, 7 bus 1-2, 5 bus 1')
+    )
+    assert housenumparser.canonical_key(label) != (
+        housenumparser.canonical_key('1-2, 3A, 3/1-3, 7 bus 1-2')
+    )
+
+
+def test_same_as_merge():
+    label = '1-99, 102, 104, 4 bus 1-3000, 6A-F, 8/1-3, 10 bus A-C'
+    merged = ', '.join(str(element) for element
+                       in housenumparser.merge(label))
+    assert merged == housenumparser.normalize(label)
+
+
+def test_bad_data():
+    label = 'foo, 1, bar'
+    assert '1, Could not parse/understand: bar, ' \
+        'Could not parse/understand: foo' == housenumparser.normalize(label)
+    assert '1, bar, foo' == housenumparser.normalize(
+        label, on_exc=ReadException.Action.KEEP_ORIGINAL
+    )
+    assert '1' == housenumparser.normalize(
+        label, on_exc=ReadException.Action.DROP
+    )
+    with pytest.raises(ValueError):
+        housenumparser.normalize(label, on_exc=ReadException.Action.RAISE)
+
+
+def test_cache(cache):
+    for label in ['1-5', '1-5', ['1-5'], '7', '1-5', '9']:
+        assert housenumparser.normalize(label)
+    info = canonical.cache_info()
+    assert 2 == info.hits
+    assert 3 == info.misses
+    assert 2 == info.currsize
+    canonical.clear_cache()
+    assert 0 == canonical.cache_info().currsize
+
+
+def test_cache_disabled_by_default():
+    assert canonical.cache_info() is None
+    canonical.clear_cache()
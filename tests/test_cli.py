@@ -0,0 +1,96 @@
+import io
+
+import pytest
+
+from housenumparser import cli
+
+
+def run(argv, data):
+    infile = io.StringIO(data)
+    outfile = io.StringIO()
+    args = cli._parse_args(argv)
+    counts = cli.run(args, infile, outfile)
+    return outfile.getvalue(), counts
+
+
+def test_split_lines():
+    output, counts = run(['split'], '1-3\n5A-B\n')
+    assert output == '1\n3\n5A\n5B\n'
+    assert counts == (2, 4)
+
+
+def test_merge_lines():
+    output, counts = run(['merge'], '1, 2, 3, 4, 5A, 5B\n4 bus 1, 4 bus 2\n')
+    assert output == '1-4, 5A-B\n4 bus 1-2\n'
+    assert counts == (2, 2)
+
+
+def test_split_csv_column_name():
+    data = 'id,label\n1,1-3\n2,10 bus 1-2\n'
+    output, counts = run(['split', 'in.csv', '--column', 'label'], data)
+    assert output == ('id,label\n1,1\n1,3\n'
+                      '2,10 bus 1\n2,10 bus 2\n')
+    assert counts == (2, 4)
+
+
+def test_merge_tsv_column_index():
+    output, _ = run(['merge', '-f', 'tsv', '-c', '1'], 'a\t1, 2\n')
+    assert output == 'a\t1-2\n'
+
+
+def test_rows_without_label():
+    data = 'id,label\n1,1-3\n\n2\n3,5\n'
+    output, counts = run(['split', 'in.csv', '--column', 'label'], data)
+    assert output == 'id,label\n1,1\n1,3\n\n2\n3,5\n'
+    assert counts == (4, 5)
+    output, _ = run(['merge', '-f', 'tsv', '-c', '1'], 'a\t1, 2\nb\n')
+    assert output == 'a\t1-2\nb\n'
+    output, _ = run(['merge'], '1, 2\n\n')
+    assert output == '1-2\nCould not parse/understand: \n'
+
+
+def test_step():
+    output, _ = run(['split', '--step', '2'], '1-5\n')
+    assert output == '1\n3\n5\n'
+
+
+def test_on_exc():
+    output, _ = run(['split', '--on-exc', 'keep_original'], '1, foo\n')
+    assert output == '1\nfoo\n'
+    output, _ = run(['split', '--on-exc', 'drop'], '1, foo\n')
+    assert output == '1\n'
+
+
+def test_workers(monkeypatch):
+    monkeypatch.setattr(cli, 'BATCH_SIZE', 7)
+    labels = ['{0}-{1}'.format(i, i + 2) for i in range(1, 200)]
+    data = '\n'.join(labels) + '\n'
+    expected, _ = run(['merge'], data)
+    output, counts = run(['merge', '--workers', '2'], data)
+    assert output == expected
+    assert counts == (199, 199)
+
+
+def test_main_files(tmp_path, capsys):
+    infile = tmp_path / 'in.csv'
+    infile.write_text('label\n1-2\n', encoding='utf-8')
+    outfile = tmp_path / 'out.csv'
+    assert cli.main(['split', str(infile), '-c', 'label',
+                     '-o', str(outfile)]) == 0
+    assert outfile.read_text(encoding='utf-8') == 'label\n1\n2\n'
+    assert '1 labels -> 2 rows' in capsys.readouterr().err
+
+
+def test_main_errors(tmp_path, capsys):
+    infile = tmp_path / 'in.csv'
+    infile.write_text('label\nfoo\n', encoding='utf-8')
+    assert cli.main(['split', str(infile), '-c', 'other', '-q']) == 1
+    assert "Column 'other' not in header." in capsys.readouterr().err
+    assert cli.main(['split', str(infile), '-c', 'label', '-q',
+                     '--on-exc', 'raise']) == 1
+    assert 'foo' in capsys.readouterr().err
+
+
+def test_invalid_arguments():
+    with pytest.raises(SystemExit):
+        cli._parse_args(['explode'])
@@ -0,0 +1,63 @@
+import pytest
+
+import housenumparser
+from housenumparser.element import BisNumber
+from housenumparser.element import BusNumber
+from housenumparser.element import ReadException
+
+LABEL = '1-9, 12, 23 bus 1-40, 25 bus A-D, 27A-C, 29/1-3, 31_4, 33 bus 2'
+
+
+@pytest.mark.parametrize('address', [
+    '1', '5', '9', '12', '23 bus 4', '23 bus 40', '25 bus C', '27B',
+    '29/2', '29_2', '31/4', '33 bus 2', BusNumber(23, 17),
+    BisNumber(29, 3, '29/3'), '3-7', '23 bus 2-30', '1, 12, 27A',
+])
+def test_contains(address):
+    assert housenumparser.contains(LABEL, address)
+
+
+@pytest.mark.parametrize('address', [
+    '2', '10', '11', '13', '23 bus 41', '23', '25 bus E', '27D', '29/4',
+    '31/5', '33 bus 1', '24 bus 4', '3-13', '1, 2', 'foo', '',
+    BusNumber(23, 0),
+])
+def test_not_contains(address):
+    assert not housenumparser.contains(LABEL, address)
+
+
+def test_contains_huge_series():
+    label = '2-1000000000000, 7 bus 1-1000000000000'
+    assert housenumparser.contains(label, '999999999998')
+    assert not housenumparser.contains(label, '999999999999')
+    assert housenumparser.contains(label, '7 bus 999999999999')
+
+
+def test_contains_step():
+    assert not housenumparser.contains('1-9', '2')
+    assert housenumparser.contains('1-9', '2', step=1)
+
+
+def test_count():
+    assert 5 + 1 + 40 + 4 + 3 + 3 + 1 + 1 == housenumparser.count(LABEL)
+    assert 1000000000000 == housenumparser.count('1 bus 1-1000000000000')
+    assert 5 == housenumparser.count('1-9, 3, 5, foo')
+    assert 7 == housenumparser.count('1-9, 3, 5, foo', distinct=False)
+    assert 9 == housenumparser.count('1-9', step=1)
+
+
+@pytest.mark.parametrize('label', [LABEL, '1-9, 3, 5', '4 bus 1-3, 4 bus 2'])
+def test_count_same_as_split(label):
+    elements = housenumparser.split(label)
+    assert len(elements) == housenumparser.count(label, distinct=False)
+    assert len({str(element) for element in elements}) == (
+        housenumparser.count(label)
+    )
+
+
+def test_raise():
+    with pytest.raises(ValueError):
+        housenumparser.count('1, foo', on_exc=ReadException.Action.RAISE)
+    with pytest.raises(ValueError):
+        housenumparser.contains('1, foo', '3',
+                                on_exc=ReadException.Action.RAISE)
@@ -0,0 +1,180 @@
+import pickle
+
+import pytest
+
+import housenumparser
+from housenumparser import element
+from housenumparser.element import BisLetter
+from housenumparser.element import BisLetterSequence
+from housenumparser.element import BisNumber
+from housenumparser.element import BisNumberSequence
+from housenumparser.element import BusLetter
+from housenumparser.element import BusLetterSequence
+from housenumparser.element import BusNumber
+from housenumparser.element import BusNumberSequence
+from housenumparser.element import HouseNumber
+from housenumparser.element import HouseNumberSequence
+from housenumparser.element import ReadException
+
+
+def test_view_house_number_sequence():
+    view = HouseNumberSequence(1, 999999999).view()
+    assert 500000000 == len(view)
+    assert HouseNumber(23) in view
+    assert HouseNumber(24) not in view
+    assert BusNumber(23, 1) not in view
+    assert '1' == str(view[0])
+    assert '999999999' == str(view[-1])
+    assert ['5', '7', '9'] == [str(n) for n in view[2:5]]
+    assert 3 == len(view[2:5])
+    assert 11 == view.index(HouseNumber(23))
+    assert 1 == view.count(HouseNumber(3))
+    with pytest.raises(ValueError):
+        view.index(HouseNumber(4))
+    with pytest.raises(IndexError):
+        view[500000000]
+
+
+def test_view_bus_number_sequence():
+    view = BusNumberSequence(23, 1, 3000).view()
+    assert 3000 == len(view)
+    assert BusNumber(23, 4) in view
+    assert BusNumber(24, 4) not in view
+    assert BusNumber(23, 3001) not in view
+    assert ['23 bus 3000', '23 bus 2999'] == [str(n) for n in
+                                              reversed(view)][:2]
+
+
+def test_view_other_sequences():
+    view = BisNumberSequence(3, 1, 10, '3_1-10').view()
+    assert 10 == len(view)
+    assert BisNumber(3, 5, '3/5') in view
+    assert '3_5' == str(view[4])
+
+    view = BisLetterSequence(3, 'A', 'F').view()
+    assert 6 == len(view)
+    assert BisLetter(3, 'C') in view
+    assert BusLetter(3, 'C') not in view
+    assert ['3B', '3C'] == [str(n) for n in view[1:3]]
+
+    view = BusLetterSequence(3, 'a', 'c').view()
+    assert BusLetter(3, 'b') in view
+    assert BusLetter(3, 'B') not in view
+    assert ['3 bus a', '3 bus b', '3 bus c'] == [str(n) for n in view]
+
+
+def test_split_uses_view():
+    sequence = HouseNumberSequence(10, 12, step=1)
+    assert ([str(n) for n in sequence.view()]
+            == [str(n) for n in sequence.split()]
+            == [str(n) for n in sequence.iter_split()])
+
+
+@pytest.mark.parametrize('element', [
+    HouseNumber(1), BisNumber(1, 2, '1/2'), BisLetter(1, 'A'),
+    BusNumber(1, 2), BusLetter(1, 'A'), HouseNumberSequence(1, 5),
+    BisNumberSequence(1, 2, 3, '1/2-3'), BisLetterSequence(1, 'A', 'C'),
+    BusNumberSequence(1, 2, 3), BusLetterSequence(1, 'A', 'C'),
+    ReadException('error', data='data'),
+])
+def test_slots(element):
+    assert not hasattr(element, '__dict__')
+    copy = pickle.loads(pickle.dumps(element))
+    assert type(element) is type(copy)
+    assert str(element) == str(copy)
+    for name in ('first_house_number', 'first_bis_number', 'first_bis_letter',
+                 'first_bus_number', 'first_bus_letter', 'last_house_number',
+                 'last_bis_number', 'last_bis_letter', 'last_bus_number',
+                 'last_bus_letter'):
+        assert getattr(element, name) == getattr(copy, name)
+
+
+def test_unused_fields_default():
+    element = BusNumber(3, 4)
+    assert 3 == element.house_number
+    assert 4 == element.bus_number
+    assert -1 == element.first_bis_number
+    assert -1 == element.last_house_number
+    assert -1 == element.last_bus_number
+    assert 2 == HouseNumberSequence(1, 5).step
+
+
+def test_declared_fields_with_default_value():
+    assert -1 == BusNumber(3, -1).bus_number
+    assert -1 == BisNumber(3, -1, '3/-1').bis_number
+    assert -1 == BusLetter(3, -1).first_bus_letter
+
+    class Custom(element.SingleElement):
+        __slots__ = ('first_bus_number', 'last_bus_number')
+
+    custom = Custom(3, first_bus_number=-1, last_bus_number=5)
+    assert (3, -1, 5) == (custom.house_number, custom.first_bus_number,
+                          custom.last_bus_number)
+    assert -1 == custom.first_bis_number
+
+
+@pytest.fixture
+def interning():
+    element.configure_interning(4)
+    yield
+    element.configure_interning(None)
+
+
+def test_interning_disabled_by_default():
+    assert element.interning_info() is None
+    assert not element.interning_enabled()
+    assert HouseNumberSequence(1, 5).split()[0] is not HouseNumber(1)
+    first, second = housenumparser.split('12, 12')
+    assert first is not second
+
+
+def test_interning_sequences(interning):
+    split = housenumparser.split('1-5, 3-7, 4 bus 1-2, 4 bus 2, 6A-B, 6B')
+    assert split[1] is split[3]
+    assert [str(x) for x in split[:5]] == ['1', '3', '5', '3', '5']
+    assert split[7] is split[8]
+    assert split[10] is split[11]
+    view = BusNumberSequence(4, 1, 2).view()
+    assert view[1] is split[8]
+    assert list(reversed(view))[0] is split[8]
+
+
+def test_interning_single_elements(interning):
+    first, second, other = housenumparser.split('12/1, 12/1, 12_1')
+    assert first is second
+    assert first is not other
+    assert str(other) == '12_1'
+    assert housenumparser.split('3 bus A')[0] is BusLetterSequence(
+        3, 'A', 'B').split()[0]
+
+
+def test_interning_bis_numbers_per_separator(interning):
+    split = housenumparser.split('12/1-3, 12/2, 12_2')
+    assert split[1] is split[3]
+    assert split[3] is not split[4]
+    assert split[1].original_string == '12/2'
+    assert [str(x) for x in split] == ['12/1', '12/2', '12/3', '12/2', '12_2']
+
+
+def test_interned_elements_read_only(interning):
+    shared = housenumparser.split('3 bus 1')[0]
+    with pytest.raises(AttributeError):
+        shared.first_bus_number = 7
+    with pytest.raises(AttributeError):
+        BusNumber(3, 1).first_house_number = 4
+    assert pickle.loads(pickle.dumps(shared)).bus_number == 1
+    assert '3 bus 1' == str(housenumparser.split('3 bus 1')[0])
+    element.configure_interning(None)
+    single = BusNumber(3, 1)
+    single.first_bus_number = 7
+    assert '3 bus 7' == str(single)
+
+
+def test_interning_bounded(interning):
+    housenumparser.split('1-99')
+    info = element.interning_info()
+    assert info.currsize == 4
+    assert info.evictions == 46
+    element.clear_interning()
+    assert element.interning_info().currsize == 0
+    assert element.shared(BusNumber, 1, 2) is element.shared(BusNumber, 1, 2)
@@ -0,0 +1,82 @@
+import random
+
+import housenumparser
+from housenumparser.element import BusNumber
+from housenumparser.element import BusNumberSequence
+from housenumparser.element import HouseNumber
+from housenumparser.element import ReadException
+from housenumparser.incremental import Merger
+
+
+def _strings(elements):
+    return [str(element) for element in elements]
+
+
+def test_add_and_remove():
+    merger = Merger('1-9, 4 bus 1-30')
+    merger.add('11')
+    merger.remove('4 bus 7')
+    assert ['1-11', '4 bus 1-6', '4 bus 8-30'] == _strings(merger.elements())
+    merger.add(BusNumber(4, 7))
+    merger.remove([HouseNumber(5), '1-3'])
+    assert ['7-11', '4 bus 1-30'] == _strings(merger)
+    assert 3 + 30 == len(merger)
+    merger.remove('1-11, 4 bus 1-30')
+    assert [] == merger.elements()
+    assert 0 == len(merger)
+
+
+def test_contains():
+    merger = Merger('1-99, 4 bus 1-3000')
+    assert BusNumber(4, 2999) in merger
+    assert BusNumber(5, 2999) not in merger
+    assert BusNumberSequence(4, 10, 20) in merger
+    assert BusNumberSequence(4, 10, 3001) not in merger
+    assert HouseNumber(51) in merger
+    assert HouseNumber(52) not in merger
+
+
+def test_set_operations():
+    merger = Merger('1-9, 4 bus 1-30')
+    merger.elements()
+    merger.add('11')
+    assert ['1-11', '4 bus 1-30'] == _strings(merger)
+    assert ['1-3', '4 bus 1-30'] == _strings(merger.difference('5-11').elements())
+    assert merger.issuperset('3, 4 bus 7')
+    assert "<Merger '1-11, 4 bus 1-30'>" == repr(merger)
+
+
+def test_bad_data():
+    merger = Merger('1, A', on_exc=ReadException.Action.KEEP_ORIGINAL)
+    merger.remove('B')
+    assert ['1', 'A'] == _strings(merger.elements())
+    merger = Merger('1, A', on_exc=ReadException.Action.DROP)
+    assert ['1'] == _strings(merger.elements())
+
+
+def test_bis_numbers_keep_separator():
+    merger = Merger('3_1-4')
+    merger.add('3_5')
+    assert ['3_1-5'] == _strings(merger.elements())
+
+
+def test_same_as_merge():
+    rnd = random.Random(10)
+    forms = ['{h}', '{h}-{h2}', '{h} bus {n}', '{h} bus {n}-{n2}', '{h}/{n}',
+             '{h}/{n}-{n2}', '{h}{l}', '{h}{l}-{l2}', '{h} bus {l}-{l2}']
+    for _ in range(200):
+        tokens = []
+        for _ in range(rnd.randint(1, 12)):
+            h = rnd.randint(1, 30)
+            n = rnd.randint(1, 10)
+            l_ = rnd.randint(0, 10)
+            tokens.append(rnd.choice(forms).format(
+                h=h, h2=h + rnd.randint(0, 12), n=n, n2=n + rnd.randint(0, 8),
+                l=chr(65 + l_), l2=chr(65 + l_ + rnd.randint(0, 5))
+            ))
+        label = ', '.join(tokens)
+        merger = Merger()
+        for token in tokens:
+            merger.add(token)
+        assert sorted(_strings(housenumparser.merge(label))) == \
+            sorted(_strings(merger.elements())), label
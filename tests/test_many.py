@@ -0,0 +1,41 @@
+import pytest
+
+import housenumparser
+from housenumparser.element import ReadException
+
+LABELS = ['1-5', '2 bus 1-3, 4', 'A', '3/1, 3/2, 3/3', None, '6, 8, 10']
+
+
+def _as_str(results):
+    return [[str(element) for element in result] for result in results]
+
+
+@pytest.fixture(params=[1000, 1], ids=['in-process', 'pool'])
+def pool_threshold(request, monkeypatch):
+    monkeypatch.setattr(housenumparser, 'POOL_THRESHOLD', request.param)
+
+
+def test_split_many(pool_threshold):
+    results = housenumparser.split_many(LABELS, workers=2, chunksize=2)
+    expected = [housenumparser.split(label) for label in LABELS]
+    assert _as_str(expected) == _as_str(results)
+
+
+def test_merge_many(pool_threshold):
+    results = housenumparser.merge_many(
+        iter(LABELS), on_exc=ReadException.Action.DROP, workers=2
+    )
+    expected = [['1-5'], ['4', '2 bus 1-3'], [], ['3/1-3'], [], ['6-10']]
+    assert expected == _as_str(results)
+
+
+def test_many_raise(pool_threshold):
+    with pytest.raises(ValueError) as e:
+        housenumparser.split_many(LABELS, workers=2,
+                                  on_exc=ReadException.Action.RAISE)
+    assert 'Could not parse/understand: A' == str(e.value)
+
+
+def test_many_empty():
+    assert [] == housenumparser.split_many([])
+    assert [] == housenumparser.merge_many([], workers=4)
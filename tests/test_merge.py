@@ -1,6 +1,10 @@
+import random
+
 import pytest
 
 import housenumparser
+from housenumparser import element
+from housenumparser import merger
 from housenumparser.element import ReadException
 
 
@@ -136,3 +140,103 @@ def test_special_characters():
     assert 2 == len(house_numbers)
     assert '1-11' == str(house_numbers[0])
     assert 'Could not parse/understand: 1ëâB' == str(house_numbers[1])
+
+
+@pytest.mark.parametrize('min_run_length', [0, 8])
+@pytest.mark.parametrize('allowed_steps', [(1,), (1, 2)])
+def test_merge_numbers_vectorised(monkeypatch, allowed_steps, min_run_length):
+    pytest.importorskip('numpy')
+    rnd = random.Random(len(allowed_steps))
+    datasets = [[], [7], [3, 3], [1, 2, 3], [1, 2, 3, 4, 5, 7, 9, 10],
+                [1, 2, 4, 6], [0, 2, 3, 4, 5, 6, 8, 10]]
+    for _ in range(200):
+        size = rnd.randint(1, 60)
+        datasets.append([rnd.randint(0, 80) for _ in range(size)])
+    for data in datasets:
+        expected = merger.merge_numbers(data, lambda num: num,
+                                        lambda first, last: (first, last),
+                                        allowed_steps)
+        monkeypatch.setattr(merger, 'VECTORISE_THRESHOLD', 0)
+        monkeypatch.setattr(merger, 'MIN_MEAN_RUN_LENGTH', min_run_length)
+        result = merger.merge_numbers(data, lambda num: num,
+                                      lambda first, last: (first, last),
+                                      allowed_steps)
+        monkeypatch.undo()
+        assert expected == result
+        assert all(type(number) is int for item in result
+                   for number in (item if isinstance(item, tuple) else [item]))
+
+
+def test_merge_large_street(monkeypatch):
+    pytest.importorskip('numpy')
+    label = ', '.join(str(number) for number in range(1, 20001)
+                      if number % 7)
+    vectorised = [str(element) for element in housenumparser.merge(label)]
+    monkeypatch.setattr(merger, 'VECTORISE_THRESHOLD', float('inf'))
+    expected = [str(element) for element in housenumparser.merge(label)]
+    assert expected == vectorised
+    assert '1-6' == vectorised[0]
+
+
+def test_merge_sorted_input():
+    label = '1, 3, 5, 7, 8, 9 bus 1, 9 bus 2, 9 bus 3, 10/1, 10/2, 11A, 11B'
+    expected = [str(element) for element in housenumparser.merge(label)]
+    for order in (merger.InputOrder.SORTED, merger.InputOrder.VERIFY):
+        assert expected == [str(element) for element in
+                            housenumparser.merge(label, order=order)]
+    assert ['1-7', '8', '10/1-2', '9 bus 1-3', '11A-B'] == expected
+
+
+def test_merge_verify_unsorted_input():
+    label = '9, 7, 5, 5, 3 bus 2, 3 bus 1, 3 bus 1'
+    house_numbers = housenumparser.merge(label,
+                                         order=merger.InputOrder.VERIFY)
+    assert ['5-9', '3 bus 1-2'] == [str(element)
+                                    for element in house_numbers]
+
+
+@pytest.mark.parametrize('threshold', [0, float('inf')])
+def test_merge_numbers_sorted(monkeypatch, threshold):
+    monkeypatch.setattr(merger, 'VECTORISE_THRESHOLD', threshold)
+    if threshold == 0:
+        pytest.importorskip('numpy')
+    data = [1, 2, 3, 5, 7, 10]
+    for order in merger.InputOrder:
+        assert [(1, 2), (3, 7), 10] == merger.merge_numbers(
+            data, lambda num: num, lambda first, last: (first, last), (1, 2),
+            order=order
+        )
+    assert [(1, 2), (3, 7), 10] == merger.merge_numbers(
+        [10, 7, 5, 3, 2, 1, 1], lambda num: num,
+        lambda first, last: (first, last), (1, 2),
+        order=merger.InputOrder.VERIFY
+    )
+
+
+def test_merge_elements_same_as_merge_data():
+    label = ('9, 7, 5, 3 bus 2, 3 bus 1, 4/2, 4_1, 12A, 12B, 6 bus B, 6 bus A'
+             ', foo, 1-9, 3 bus 5-9, 14 bus 1-3')
+    numbers = housenumparser.split(label)
+    expected = [str(element) for element in
+                merger.merge_data(merger.group(numbers))]
+    assert expected == [str(element)
+                        for element in merger.merge_elements(numbers)]
+    assert ['1-9'] == [str(element) for element in merger.merge_elements(
+        housenumparser.split('1-9, foo'), on_exc=ReadException.Action.DROP
+    )]
+
+
+def test_bucket_subclasses():
+    class Number(element.HouseNumber):
+        __slots__ = ()
+
+    class Bus(element.BusNumber):
+        __slots__ = ()
+
+    buckets = merger.bucket([Number(3), Number(1), Bus(5, 2), Bus(5, 1),
+                             element.HouseNumber(2), Number(4)])
+    assert {None: [3, 1, 2, 4]} == buckets.numbers[0]
+    assert {5: [2, 1]} == buckets.numbers[2]
+    assert ['1-4', '5 bus 1-2'] == [
+        str(number) for number in merger.merge_buckets(buckets)
+    ]
@@ -0,0 +1,176 @@
+import random
+
+import pytest
+
+import housenumparser
+from housenumparser import merger
+from housenumparser import ranges
+from housenumparser.element import BisNumber
+from housenumparser.element import BisNumberSequence
+from housenumparser.element import BusLetterSequence
+from housenumparser.element import HouseNumber
+from housenumparser.element import HouseNumberSequence
+from housenumparser.incremental import Merger
+from housenumparser.sets import HouseNumberSet
+
+
+def test_interval_list():
+    intervals = ranges.IntervalList([(5, 7), (1, 2), (10, 12)])
+    assert [(1, 2), (5, 7), (10, 12)] == list(intervals.intervals())
+    intervals.add(3, 4)
+    assert [(1, 7), (10, 12)] == list(intervals.intervals())
+    intervals.remove(3, 10)
+    assert [(1, 2), (11, 12)] == list(intervals.intervals())
+    assert [1, 2, 11, 12] == list(intervals)
+    assert 4 == len(intervals)
+    assert 2 in intervals
+    assert 3 not in intervals
+    intervals.remove(0, 20)
+    assert not intervals
+
+
+def test_interval_list_algebra():
+    left = ranges.IntervalList([(1, 10), (20, 30)])
+    right = ranges.IntervalList([(5, 25)])
+    assert [(1, 30)] == list(left.union(right).intervals())
+    assert [(5, 10), (20, 25)] == list(left.intersection(right).intervals())
+    assert [(1, 4), (26, 30)] == list(left.difference(right).intervals())
+    assert ranges.IntervalList([(2, 3), (21, 22)]).issubset(left)
+    assert not right.issubset(left)
+    assert left == ranges.IntervalList([(20, 30), (1, 10)])
+
+
+def test_range_set():
+    numbers = ranges.RangeSet()
+    numbers.add(1, 99, step=2)
+    numbers.add(10, 14)
+    assert 50 + 3 == len(numbers)
+    assert 99 in numbers
+    assert 12 in numbers
+    assert 16 not in numbers
+    numbers.remove(1, 97, step=2)
+    assert [10, 12, 14, 99] == list(numbers)
+    assert [(10, 14), (99, 99)] == list(numbers.segments())
+    numbers.add(1, 10, step=3)
+    assert [1, 4, 7, 10, 12, 14, 99] == list(numbers)
+
+
+@pytest.mark.parametrize('allowed_steps', [(1,), (1, 2), (1, 2, 3)])
+def test_runs_same_as_merge_numbers(allowed_steps):
+    rnd = random.Random(len(allowed_steps))
+    for _ in range(300):
+        numbers = ranges.RangeSet()
+        expected = set()
+        for _ in range(rnd.randint(1, 6)):
+            first = rnd.randint(0, 60)
+            last = first + rnd.randint(0, 20)
+            step = rnd.choice((1, 2))
+            numbers.add(first, last, step)
+            expected.update(range(first, last + 1, step))
+        assert sorted(expected) == list(numbers)
+        assert merger.merge_numbers(
+            expected, lambda number: (number, number),
+            lambda first, last: (first, last), allowed_steps
+        ) == list(numbers.runs(allowed_steps))
+
+
+def test_runs_do_not_expand():
+    numbers = ranges.RangeSet()
+    numbers.add(1, 10 ** 12, step=2)
+    numbers.add(10 ** 12 + 10, 10 ** 13)
+    assert [(1, 10 ** 12 - 1), (10 ** 12 + 10, 10 ** 13 - 1),
+            (10 ** 13, 10 ** 13)] == list(numbers.runs((1, 2)))
+
+
+def test_runs_of_long_clusters_do_not_expand(monkeypatch):
+    merge_numbers = ranges._merge_numbers
+
+    def short_merge_numbers(numbers, *args, **kwargs):
+        assert len(numbers) < 100
+        return merge_numbers(numbers, *args, **kwargs)
+
+    monkeypatch.setattr(ranges, '_merge_numbers', short_merge_numbers)
+    numbers = ranges.RangeSet()
+    numbers.add(2, 2000000)
+    numbers.remove(7)
+    assert [(2, 5), (6, 8), (9, 2000000)] == list(numbers.runs((1, 2)))
+    merged = Merger('4 bus 1-1000000')
+    merged.remove('4 bus 7')
+    assert ['4 bus 1-6', '4 bus 8-1000000'] == [
+        str(element) for element in merged.elements()
+    ]
+    numbers = HouseNumberSet('1-1000000, 4 bus 1-1000000')
+    numbers.remove('7, 4 bus 7')
+    assert ("<HouseNumberSet '1-6, 8-999999, 1000000, 4 bus 1-6, "
+            "4 bus 8-1000000'>") == repr(numbers)
+
+
+def test_bounds_and_build():
+    kind, key, first, last, step = ranges.bounds(HouseNumberSequence(1, 9))
+    assert (HouseNumber, None, 1, 9, 2) == (kind.single_class, key, first,
+                                            last, step)
+    assert '1-9' == str(ranges.build(kind, key, first, last))
+    assert '3' == str(ranges.build(kind, key, 3, 3))
+    kind, key, first, last, step = ranges.bounds(BusLetterSequence(3, 'a',
+                                                                   'c'))
+    assert (3, 97, 99, 1) == (key, first, last, step)
+    assert '3 bus a-c' == str(ranges.build(kind, key, first, last))
+    kind, key, first, last, step = ranges.bounds(BisNumber(3, 4, '3_4'))
+    assert (BisNumber, 3, 4, 4) == (kind.single_class, key, first, last)
+    assert '3_4-5' == str(ranges.build(kind, key, 4, 5, '3_4-5'))
+    assert isinstance(ranges.build(kind, key, 4, 5), BisNumberSequence)
+
+
+def test_merge_same_as_split_merge():
+    random.seed(21)
+    tokens = ['1-9', '2-12', '11', '3-7', '4 bus 1-30', '4 bus 31', '4 bus 7',
+              '6/1-3', '6_4', '8A-C', '8D', '8 bus A-B', '10 bus C', 'foo']
+    for _ in range(200):
+        label = ', '.join(random.sample(tokens, random.randint(1, 8)))
+        expected = merger.merge_elements(housenumparser.split(label))
+        assert [str(element) for element in expected] == [
+            str(element) for element in ranges.merge(label)
+        ]
+
+
+def test_merge_keeps_series_as_ranges(monkeypatch):
+    expanded = []
+    monkeypatch.setattr(HouseNumberSequence, 'iter_split',
+                        lambda self: expanded.append(self))
+    merge_numbers = ranges._merge_numbers
+
+    def short_merge_numbers(numbers, *args, **kwargs):
+        expanded.extend(numbers)
+        return merge_numbers(numbers, *args, **kwargs)
+
+    monkeypatch.setattr(ranges, '_merge_numbers', short_merge_numbers)
+    result = ranges.merge('4 bus 1-3000, 1-9999, 4 bus 3001, 9999')
+    assert ['1-9999', '4 bus 1-3001'] == [
+        str(element) for element in result
+    ]
+    result = housenumparser.merge('4 bus 1-1000000, 4 bus 1000002-2000000, '
+                                  '2-2000000, 1000001-1000009')
+    assert ['2-1000000', '1000001-1000010', '1000012-2000000',
+            '4 bus 1-1000000', '4 bus 1000002-2000000'] == [
+        str(element) for element in result
+    ]
+    assert [] == expanded
+
+
+def test_merge_order(monkeypatch):
+    orders = []
+    merge_numbers = ranges._merge_numbers
+
+    def recording_merge_numbers(numbers, allowed_steps, order):
+        orders.append(order)
+        return merge_numbers(numbers, allowed_steps, order)
+
+    monkeypatch.setattr(ranges, '_merge_numbers', recording_merge_numbers)
+    label = '1, 3, 5, 4 bus 1, 4 bus 2, 6-10'
+    for order in merger.InputOrder:
+        assert ['1-5', '6-10', '4 bus 1-2'] == [
+            str(element) for element in housenumparser.merge(label,
+                                                             order=order)
+        ]
+        assert [order] == orders
+        orders.clear()
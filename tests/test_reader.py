@@ -0,0 +1,242 @@
+import mmap
+import re
+
+import pytest
+
+from housenumparser import reader
+from housenumparser.element import BisNumber
+from housenumparser.element import BisNumberSequence
+from housenumparser.element import HouseNumberSequence
+from housenumparser.element import ReadException
+
+TOKENS = [
+    '23', '0', '007', '23 bus 4', '23bus4', '23 bus 4-9', '23 bus A',
+    '23 bus a-c', '23 bus AB', '23/1', '23_1', '23/1-5', '23_2-4', '23A',
+    '23/A', '23_A', '23A-D', '23/B-C', '23-29', '23-30', '23 - 29', '2 3',
+    '23 bus', '23-', '-23', 'A', '?', '', '1ëâB', '23 BUS 4', '23/1/2',
+    '٣', '²', '10-5', '1 bus 6-2', '1/6-2', '1 bus D-A', '25F-C',
+    '25_A-C', '25/A-C', '1 2 bus 3', '23\tbus\t4', '1\u00a0bus 2', '23/',
+    '23 bus 4-', '23bus/4', '1,2', '23 bus 4 - 9', '23A-', '12٣ bus 1',
+]
+
+
+@pytest.fixture(params=sorted(reader.ENGINES))
+def engine(request):
+    reader.configure_engine(request.param)
+    yield request.param
+    reader.configure_engine()
+
+
+def _read_element_per_class(data, step=None):
+    """The reference implementation: try every class regex in order."""
+    stripped_data = re.sub(r'\s', '', data)
+    for element_class in reader.ELEMENT_CLASSES:
+        match = element_class.regex.match(stripped_data)
+        if match:
+            args = [int(group) if group.isdigit() else group
+                    for group in match.groups()]
+            kwargs = {}
+            if element_class is HouseNumberSequence:
+                kwargs['step'] = step
+            if element_class in [BisNumber, BisNumberSequence]:
+                kwargs['original_string'] = stripped_data
+            return element_class(*args, **kwargs)
+    return None
+
+
+def _describe(element):
+    if element is None:
+        return None
+    return type(element), str(element), sorted(
+        (slot, getattr(element, slot)) for slot in dir(element)
+        if slot.startswith(('first_', 'last_', 'step', 'original_string'))
+    )
+
+
+@pytest.mark.parametrize('token', TOKENS)
+@pytest.mark.parametrize('step', [None, 1, 2])
+def test_read_element_same_as_per_class(engine, token, step):
+    try:
+        expected = _describe(_read_element_per_class(token, step=step))
+    except ValueError as e:
+        expected = str(e)
+    element = reader.read_element(token, step=step)
+    if isinstance(expected, str):
+        assert expected == element.error
+    elif expected is None:
+        assert 'Could not parse/understand' == element.error
+    else:
+        assert expected == _describe(element)
+
+
+@pytest.mark.parametrize('token', ['25bus-C', '1AB-C', '1/A-BC',
+                                   '1 bus AB-C'])
+def test_read_element_multiple_letters(engine, token):
+    with pytest.raises(TypeError) as expected:
+        _read_element_per_class(token)
+    with pytest.raises(TypeError) as error:
+        reader.read_element(token)
+    assert str(expected.value) == str(error.value)
+
+
+@pytest.mark.parametrize('on_exc', [ReadException.Action.ERROR_MSG,
+                                    ReadException.Action.KEEP_ORIGINAL,
+                                    ReadException.Action.DROP])
+def test_scanner_same_as_regex(on_exc):
+    label = ', '.join(token for token in TOKENS if token != '1,2')
+    label += ',, 3 bus 1-4 ,7_2'
+    reader.configure_engine('regex')
+    expected = [_describe(element) if not isinstance(element, ReadException)
+                else (element.error, element.data, str(element))
+                for element in reader.read_data(label, on_exc=on_exc)]
+    reader.configure_engine('scanner')
+    try:
+        result = [_describe(element)
+                  if not isinstance(element, ReadException)
+                  else (element.error, element.data, str(element))
+                  for element in reader.read_data(label, on_exc=on_exc)]
+    finally:
+        reader.configure_engine()
+    assert expected == result
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        reader.configure_engine('lexer')
+
+
+def test_element_classes_precedence():
+    for token, name in [('1bus2-3', 'BusNumberSequence'),
+                        ('1busa-c', 'BusLetterSequence'),
+                        ('1a-c', 'BisLetterSequence'),
+                        ('1busa', 'BusLetter'),
+                        ('1/a', 'BisLetter')]:
+        assert name == reader.read_element(token).__class__.__name__
+
+
+@pytest.fixture
+def parse_cache():
+    reader.configure_cache(3)
+    yield
+    reader.configure_cache(None)
+
+
+def test_cache_disabled_by_default():
+    assert reader.cache_info() is None
+    reader.clear_cache()
+
+
+def test_cache_statistics(parse_cache):
+    for token in ['1', '2', ' 1 ', '3 bus 1', '4', '1']:
+        reader.read_element(token)
+    info = reader.cache_info()
+    assert 2 == info.hits
+    assert 4 == info.misses
+    assert 1 == info.evictions
+    assert 3 == info.maxsize
+    assert 3 == info.currsize
+    reader.clear_cache()
+    assert (0, 0, 0, 3, 0) == tuple(reader.cache_info())
+
+
+def test_cache_returns_new_elements(parse_cache):
+    first = reader.read_element('3 bus 1')
+    first.first_bus_number = 7
+    second = reader.read_element('3 bus 1')
+    assert first is not second
+    assert '3 bus 1' == str(second)
+
+
+def test_cache_step_and_errors(parse_cache):
+    assert 1 == reader.read_element('10-12', step=1).step
+    assert 2 == reader.read_element('10-12', step=2).step
+    for _ in range(2):
+        assert 'Incorrect range: 10 - 5' == str(reader.read_element('10 - 5'))
+        assert 'A' == str(reader.read_element(
+            'A', on_exc=ReadException.Action.KEEP_ORIGINAL
+        ))
+    with pytest.raises(ValueError):
+        reader.read_element('A', on_exc=ReadException.Action.RAISE)
+    assert reader.read_element('A', on_exc=ReadException.Action.DROP) is None
+
+
+@pytest.mark.parametrize('token', TOKENS)
+def test_check_element_same_as_read_element(engine, token):
+    try:
+        element = reader.read_element(token.strip())
+    except TypeError:
+        # Letter series with multiple letters can't be created at all.
+        assert 'Could not parse/understand' == reader.check_element(token)
+        return
+    reason = reader.check_element(token.strip())
+    if isinstance(element, ReadException):
+        assert f'{reason}: {token.strip()}' == str(element)
+    else:
+        assert reason is None
+
+
+def test_validate(engine):
+    validation = reader.validate(' 1, 3-1,foo , 4 bus 2, 8 bus 5-2,')
+    assert not validation.valid
+    assert [
+        (1, 4, '3-1', 'Incorrect range'),
+        (2, 8, 'foo', 'Could not parse/understand'),
+        (4, 23, '8 bus 5-2', 'Incorrect range'),
+        (5, 33, '', 'Could not parse/understand'),
+    ] == validation.errors
+    assert (True, []) == reader.validate('1-9, 4 bus 1-30, 6A-C')
+    assert [(1, 0, '3_2-1', 'Incorrect range')] == reader.validate(
+        ['1', ' 3_2-1 ']
+    ).errors
+    assert [True, False] == [validation.valid for validation in
+                             reader.validate_many(['1, 3', '1, 3-'])]
+
+
+def _readable(token):
+    try:
+        reader.read_element(token.strip())
+    except TypeError:
+        # Letter series with multiple letters, see test_check_element.
+        return False
+    return True
+
+
+@pytest.mark.parametrize('on_exc', [ReadException.Action.ERROR_MSG,
+                                    ReadException.Action.KEEP_ORIGINAL,
+                                    ReadException.Action.DROP])
+def test_read_bytes_same_as_read_data(engine, on_exc):
+    data = ', '.join(token for token in TOKENS
+                     if ',' not in token and _readable(token))
+    expected = [_describe(element) for element in
+                reader.read_data(data, on_exc=on_exc)]
+    encoded = data.encode('utf-8')
+    for buffer in (encoded, bytearray(encoded), memoryview(encoded)):
+        assert expected == [_describe(element) for element in
+                            reader.read_bytes(buffer, on_exc=on_exc)]
+        assert expected == [_describe(element) for element in
+                            reader.read_data(buffer, on_exc=on_exc)]
+
+
+def test_read_bytes_undecodable():
+    assert ['Could not parse/understand: 1�'] == [
+        str(element) for element in reader.read_bytes(b'1\xff')
+    ]
+    assert ['1', '2'] == [str(element) for element in reader.read_bytes(
+        b'1,2', encoding='latin-1'
+    )]
+
+
+def test_iter_read_lines(tmp_path):
+    path = tmp_path / 'labels.txt'
+    path.write_bytes(b'1-5, 3 bus 2\r\n\nfoo,7\n')
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            lines = [(offset, [str(element) for element in elements])
+                     for offset, elements in reader.iter_read_lines(data)]
+            first = reader.iter_read_bytes(data, start=0, end=1)
+            assert ['1'] == [str(element) for element in first]
+    assert [
+        (0, ['1-5', '3 bus 2']),
+        (14, ['Could not parse/understand: ']),
+        (15, ['Could not parse/understand: foo', '7']),
+    ] == lines
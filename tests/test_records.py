@@ -0,0 +1,53 @@
+import json
+
+import pytest
+
+import housenumparser
+from housenumparser import records
+from housenumparser.element import ReadException
+
+LABELS = [
+    '1-9, 4 bus 1-3, 6A-C, 7, 8/1-2, 8_3, foo, 10 bus A-B, 12/D',
+    '25-29, 27, 2 bus 3, 2 bus 1, 2 bus 2, 3_1, 3_2, 11A, 11B, 12-8',
+    ['5', '1-3', '4 bus 1'],
+]
+
+
+@pytest.mark.parametrize('label', LABELS)
+@pytest.mark.parametrize('on_exc', [ReadException.Action.ERROR_MSG,
+                                    ReadException.Action.KEEP_ORIGINAL,
+                                    ReadException.Action.DROP])
+def test_records_same_as_elements(label, on_exc):
+    for step in (None, 1, 2):
+        assert [records.to_record(element) for element in housenumparser.split(
+            label, step=step, on_exc=on_exc
+        )] == records.split_records(label, step=step, on_exc=on_exc)
+    assert [records.to_record(element) for element in housenumparser.merge(
+        label, on_exc=on_exc
+    )] == records.merge_records(label, on_exc=on_exc)
+
+
+def test_record_fields():
+    assert [
+        ('HouseNumberSequence', 1, 1, 5, '1-5'),
+        ('BusNumberSequence', 4, 1, 2, '4 bus 1-2'),
+        ('BisLetter', 6, 'A', 'A', '6A'),
+        ('ReadException', None, None, None, 'foo'),
+    ] == records.merge_records('1, 3, 5, 4 bus 1, 4 bus 2, 6A, foo',
+                               on_exc=ReadException.Action.KEEP_ORIGINAL)
+    assert ('BisNumber', 3, 2, 2, '3_2') == records.split_records('3_2')[0]
+
+
+def test_to_json():
+    merged = records.merge_records('1, 3, 4 bus A')
+    assert [
+        {'kind': 'HouseNumberSequence', 'house_number': 1, 'first': 1,
+         'last': 3, 'label': '1-3'},
+        {'kind': 'BusLetter', 'house_number': 4, 'first': 'A', 'last': 'A',
+         'label': '4 bus A'},
+    ] == json.loads(records.to_json(merged))
+    assert [['HouseNumberSequence', 1, 1, 3, '1-3'],
+            ['BusLetter', 4, 'A', 'A', '4 bus A']] == json.loads(
+        records.to_json(housenumparser.merge('1, 3, 4 bus A'), objects=False)
+    )
+    assert '[]' == records.to_json([])
@@ -0,0 +1,109 @@
+import random
+
+import housenumparser
+from housenumparser import HouseNumberSet
+from housenumparser.element import BisNumber
+from housenumparser.element import BusNumber
+from housenumparser.element import BusNumberSequence
+from housenumparser.element import HouseNumber
+from housenumparser.element import ReadException
+
+
+def _strings(elements):
+    return [str(element) for element in elements]
+
+
+def test_algebra():
+    permit = HouseNumberSet('1-99, 4 bus 1-3000')
+    register = HouseNumberSet('5-9, 4 bus 12-2000')
+    assert register <= permit
+    assert register < permit
+    assert not permit <= register
+    assert permit >= register
+    assert ['1-3', '11-99', '4 bus 1-11', '4 bus 2001-3000'] == _strings(
+        (permit - register).elements()
+    )
+    assert ['5-9', '4 bus 12-2000'] == _strings(
+        (permit & register).elements()
+    )
+    assert permit == permit | register
+    assert permit - register == permit ^ register
+    assert not (permit - register) & register
+    assert (permit - register).isdisjoint(register)
+
+
+def test_methods_accept_labels():
+    numbers = HouseNumberSet('2-10')
+    assert numbers.issubset('1-10')
+    assert numbers.issuperset('4, 6')
+    assert ['2-3', '4-10', '4 bus 1'] == _strings(
+        numbers.union('3, 4 bus 1').elements()
+    )
+    assert ['2', '10'] == _strings(numbers.difference('4-8').elements())
+    assert ['4-6'] == _strings(numbers.intersection('3-6').elements())
+
+
+def test_step_2_series():
+    odd = HouseNumberSet('1-99')
+    assert 50 == len(odd)
+    assert HouseNumberSet('1-10, 11-99') != odd
+    assert HouseNumberSet('1-10', step=2) <= odd
+    assert HouseNumberSet('2-10') & odd == HouseNumberSet()
+    assert ['1-100'] == _strings((odd | HouseNumberSet('2-100')).elements())
+
+
+def test_iteration_and_contains():
+    numbers = HouseNumberSet('6, 4 bus 2-3, 1-3, 10/1-2, 3A')
+    assert ['1', '3', '6', '10/1', '10/2', '4 bus 2', '4 bus 3',
+            '3A'] == _strings(numbers)
+    assert HouseNumber(3) in numbers
+    assert HouseNumber(2) not in numbers
+    assert BusNumberSequence(4, 2, 3) in numbers
+    assert BusNumber(4, 4) not in numbers
+    assert BisNumber(10, 2, '10_2') in numbers
+    assert '1, 3, 4 bus 2' in numbers
+    assert 'foo' not in numbers
+    assert ReadException('error', 'foo') not in numbers
+
+
+def test_add_remove_and_bad_data():
+    numbers = HouseNumberSet('1-9, foo',
+                             on_exc=ReadException.Action.KEEP_ORIGINAL)
+    assert ['foo'] == _strings(numbers.bad_data)
+    numbers.add(['11', HouseNumber(13)])
+    numbers.remove('1-5, bar')
+    assert ['7-13'] == _strings(numbers.elements())
+    copy = numbers.copy()
+    copy.remove('7-13')
+    assert not copy
+    assert numbers
+    assert "<HouseNumberSet '7-13'>" == repr(numbers)
+
+
+def test_large_ranges_stay_ranges():
+    big = HouseNumberSet('1 bus 1-1000000000, 3 bus 1-1000000000')
+    small = HouseNumberSet('1 bus 500-600')
+    assert small <= big
+    assert 2 * 10 ** 9 - 101 == len(big - small)
+
+
+def test_same_as_python_sets():
+    rnd = random.Random(4)
+    for _ in range(100):
+        labels = []
+        for _ in range(2):
+            labels.append(', '.join(
+                rnd.choice(['{0}-{1}', '4 bus {0}-{1}', '6/{0}-{1}']).format(
+                    first, first + rnd.randint(0, 8))
+                for first in rnd.sample(range(1, 30), 4)
+            ))
+        first, second = (HouseNumberSet(label) for label in labels)
+        first_strings, second_strings = (
+            set(_strings(housenumparser.split(label))) for label in labels
+        )
+        assert set(_strings(first | second)) == first_strings | second_strings
+        assert set(_strings(first & second)) == first_strings & second_strings
+        assert set(_strings(first - second)) == first_strings - second_strings
+        assert set(_strings(first ^ second)) == first_strings ^ second_strings
+        assert (first <= second) == (first_strings <= second_strings)
+        assert len(first) == len(first_strings)
@@ -365,3 +365,47 @@ def test_split_wrong_bus_letter_range():
 def test_wrong_on_exc():
     element = ReadException('error_msg', on_exc='ïnvalid')
     assert '<ReadException> Not implemented on_exc: ïnvalid' == str(element)
+
+
+def test_iter_split_is_lazy():
+    house_numbers = housenumparser.iter_split('1-999999999, 3')
+    assert not isinstance(house_numbers, list)
+    assert '1' == str(next(house_numbers))
+    assert '3' == str(next(house_numbers))
+    house_numbers.close()
+
+
+def test_iter_split_same_as_split():
+    label = '25C-F,28-32,29 bus 2-5, A, 1/3-4'
+    for on_exc in (ReadException.Action.ERROR_MSG,
+                   ReadException.Action.KEEP_ORIGINAL,
+                   ReadException.Action.DROP):
+        assert ([str(n) for n in housenumparser.split(label, on_exc=on_exc)]
+                == [str(n) for n in housenumparser.iter_split(label,
+                                                              on_exc=on_exc)])
+    assert (['10', '11', '12'] ==
+            [str(n) for n in housenumparser.iter_split(['10-12'], step=1)])
+
+
+def test_iter_split_raise_errors():
+    house_numbers = housenumparser.iter_split(
+        '1, A', on_exc=ReadException.Action.RAISE
+    )
+    assert '1' == str(next(house_numbers))
+    with pytest.raises(ValueError):
+        next(house_numbers)
+
+
+def test_split_unique():
+    label = '33, 1-9, 4 bus 2, foo, 5-15, 2 bus 1-3, 4 bus 1-2, 3/1, 3_1, 7'
+    result = housenumparser.split(label, unique=True)
+    assert ['1', '3', '5', '7', '9', '11', '13', '15', '33', '3_1',
+            '2 bus 1', '2 bus 2', '2 bus 3', '4 bus 1', '4 bus 2',
+            'Could not parse/understand: foo'] == [str(element)
+                                                   for element in result]
+    assert ['1', '3', '5'] == [str(element) for element in housenumparser.split(
+        ['5', '1-5'], unique=True
+    )]
+    assert ['1', '2'] == [str(element) for element in housenumparser.split(
+        '2, 1, foo', unique=True, on_exc=ReadException.Action.DROP
+    )]
@@ -0,0 +1,91 @@
+import pytest
+
+import housenumparser
+from housenumparser import reader
+from housenumparser import stats
+from housenumparser.element import ReadException
+
+
+@pytest.fixture
+def collector():
+    yield stats.enable()
+    stats.disable()
+
+
+def test_disabled_by_default():
+    assert stats.collector is None
+    assert stats.disable() is None
+
+
+def test_element_counters(collector):
+    housenumparser.split('1-5, 7, 4 bus 1-3, 6A, foo, 8/1')
+    assert collector.elements == {
+        'HouseNumberSequence': 1,
+        'HouseNumber': 1,
+        'BusNumberSequence': 1,
+        'BisLetter': 1,
+        'ReadException': 1,
+        'BisNumber': 1,
+    }
+    assert collector.read_exceptions == 1
+
+
+def test_read_exceptions_counted_for_every_action(collector):
+    for action in (ReadException.Action.ERROR_MSG,
+                   ReadException.Action.KEEP_ORIGINAL,
+                   ReadException.Action.DROP):
+        reader.read_element('foo', on_exc=action)
+    with pytest.raises(ValueError):
+        reader.read_element('foo', on_exc=ReadException.Action.RAISE)
+    assert collector.read_exceptions == 4
+
+
+def test_expansions(collector):
+    housenumparser.split('1-9, 4 bus 1-30, 6A-C, 7')
+    assert collector.expansions == {
+        'HouseNumberSequence': 5,
+        'BusNumberSequence': 30,
+        'BisLetterSequence': 3,
+    }
+
+
+def test_merge_timings(collector):
+    result = housenumparser.merge('1, 3, 5, 4 bus 1, 4 bus 2')
+    assert [str(element) for element in result] == ['1-5', '4 bus 1-2']
+    assert collector.calls == {'read': 1, 'group': 1, 'merge_data': 1}
+    assert all(seconds >= 0 for seconds in collector.timings.values())
+    exported = collector.as_dict()
+    assert exported['calls'] == dict(collector.calls)
+    assert exported['elements']['HouseNumber'] == 3
+    assert exported['read_exceptions'] == 0
+
+
+def test_reset(collector):
+    housenumparser.merge('1-5, foo')
+    collector.reset()
+    assert collector.as_dict() == {
+        'elements': {},
+        'read_exceptions': 0,
+        'expansions': {},
+        'calls': {},
+        'timings': {},
+    }
+
+
+def test_custom_collector():
+    class Recorder(stats.Stats):
+        def __init__(self):
+            super().__init__()
+            self.stages = []
+
+        def record_timing(self, stage, seconds):
+            self.stages.append(stage)
+
+    recorder = Recorder()
+    assert stats.enable(recorder) is recorder
+    try:
+        housenumparser.merge('1-5')
+    finally:
+        assert stats.disable() is recorder
+    assert recorder.stages == ['read', 'group', 'merge_data']
+    assert stats.collector is None